@@ -0,0 +1,92 @@
+"""Compare the old all-pairs collision scan with the spatial hash broadphase.
+
+Run from the repository root:
+    python -m benchmarks.collision_benchmark
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from entities.actor import Actor
+from entities.bullet import Bullet
+from entities.enemy import Enemy
+from systems.entity_manager import EntityManager
+from tags.tags import Tag
+
+ENTITY_COUNTS = [50, 100, 200, 400, 800]
+REPEATS = 5
+
+
+def populate(screen: pygame.Surface, count: int) -> EntityManager:
+    """Fill an entity manager with two thirds enemies and one third bullets"""
+    entity_manager = EntityManager()
+    for i in range(count):
+        pos = pygame.Vector2(
+            random.uniform(0, screen.get_width()),
+            random.uniform(0, screen.get_height()),
+        )
+        if i % 3 == 2:
+            direction = pygame.Vector2(1, 0).rotate(random.uniform(0, 360))
+            entity = Bullet([Tag.PLAYER], screen, pos, direction)
+        else:
+            entity = Enemy(screen, pos)
+        entity_manager.instantiate(entity)
+    return entity_manager
+
+
+def time_all_pairs(entity_manager: EntityManager) -> tuple[float, int]:
+    hits = 0
+    start = time.perf_counter()
+    for actor in entity_manager.entities:
+        for entity in entity_manager.entities:
+            if entity != actor and isinstance(entity, Actor):
+                if actor.check_collision(entity):
+                    hits += 1
+    return time.perf_counter() - start, hits
+
+
+def time_spatial_hash(entity_manager: EntityManager) -> tuple[float, int]:
+    hits = 0
+    start = time.perf_counter()
+    for actor in entity_manager.entities:
+        for entity in entity_manager.get_collision_candidates(actor):
+            if entity is not actor and actor.check_collision(entity):
+                hits += 1
+    return time.perf_counter() - start, hits
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    random.seed(0)
+
+    print(
+        f"{'entities':>8} {'all pairs (ms)':>15} {'spatial hash (ms)':>18} {'speedup':>8}"
+    )
+    for count in ENTITY_COUNTS:
+        entity_manager = populate(screen, count)
+        naive_times, hashed_times = [], []
+        for _ in range(REPEATS):
+            naive_time, naive_hits = time_all_pairs(entity_manager)
+            hashed_time, hashed_hits = time_spatial_hash(entity_manager)
+            assert naive_hits == hashed_hits, "broadphase missed a collision"
+            naive_times.append(naive_time)
+            hashed_times.append(hashed_time)
+
+        naive_ms = min(naive_times) * 1000
+        hashed_ms = min(hashed_times) * 1000
+        print(
+            f"{count:>8} {naive_ms:>15.2f} {hashed_ms:>18.2f} {naive_ms / hashed_ms:>7.1f}x"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
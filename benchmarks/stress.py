@@ -0,0 +1,227 @@
+"""Stress scenarios for the game loop, run headless with fixed dt and scripted input.
+
+Writes per-frame update and render timing percentiles for every scenario to a JSON
+file so regressions show up as numbers. Run from the repository root:
+
+    python -m benchmarks.stress --frames 600 --output bench_results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+
+import pygame
+
+from headless import (
+    FIXED_DT,
+    circling_fire_script,
+    create_level,
+    create_screen,
+    run_level,
+)
+from entities.blast import Blast
+from entities.bullet import Bullet
+from entities.dasher import Dasher
+from entities.enemy import Enemy
+from entities.wanderer import Wanderer
+from systems.input_source import ScriptedInput
+from tags.tags import Tag
+
+WARMUP_FRAMES = 60
+
+
+def random_position(level) -> pygame.Vector2:
+    return pygame.Vector2(
+        random.uniform(0, level.screen.get_width()),
+        random.uniform(0, level.screen.get_height()),
+    )
+
+
+def spawn_enemies(level, count: int):
+    for _ in range(count):
+        enemy_type = random.choice((Enemy, Enemy, Wanderer, Dasher))
+        level.entity_manager.instantiate(
+            enemy_type(level.screen, random_position(level))
+        )
+
+
+def keep_enemies(count: int):
+    """Frame hook that tops the enemy population back up to count"""
+
+    def on_frame(level, frame):
+        missing = count - level.entity_manager.count(Tag.ENEMY)
+        if missing > 0:
+            spawn_enemies(level, missing)
+
+    return on_frame
+
+
+def keep_bullets(count: int):
+    """Frame hook that tops the live player bullets back up to count"""
+
+    def on_frame(level, frame):
+        missing = count - level.entity_manager.count(Bullet)
+        for _ in range(missing):
+            direction = pygame.Vector2(1, 0).rotate(random.uniform(0, 360))
+            level.entity_manager.spawn(
+                Bullet,
+                [Tag.PLAYER],
+                level.screen,
+                random_position(level),
+                direction,
+            )
+
+    return on_frame
+
+
+def combine(*hooks):
+    def on_frame(level, frame):
+        for hook in hooks:
+            hook(level, frame)
+
+    return on_frame
+
+
+def continuous_blast(level, frame):
+    """Start a new Blast every 30 frames, on top of the player's own"""
+    if frame % 30 == 0:
+        level.entity_manager.instantiate(Blast(level.screen, random_position(level)))
+
+
+def blast_script(frame: int) -> dict:
+    state = circling_fire_script(frame)
+    state["keys"] = state["keys"] | {pygame.K_SPACE}
+    return state
+
+
+# name -> (input script, enemies at start, frame hook, keep spawning waves)
+SCENARIOS = {
+    "enemies_500": (None, 500, None, False),
+    "bullets_200": (None, 50, combine(keep_enemies(50), keep_bullets(200)), False),
+    "continuous_blast": (
+        blast_script,
+        150,
+        combine(keep_enemies(150), continuous_blast),
+        False,
+    ),
+    "sustained_fire": (circling_fire_script, 0, None, True),
+    "enemies_3000": (None, 3000, None, False),
+}
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> dict:
+    """Timing summary in milliseconds"""
+    return {
+        "p50": percentile(samples, 0.50) * 1000,
+        "p95": percentile(samples, 0.95) * 1000,
+        "p99": percentile(samples, 0.99) * 1000,
+        "mean": sum(samples) / len(samples) * 1000,
+        "max": max(samples) * 1000,
+    }
+
+
+def run_scenario(
+    screen, name: str, frames: int, dt: float, seed: int, batch_enemies: bool = False
+) -> dict:
+    script, enemy_count, on_frame, waves = SCENARIOS[name]
+    random.seed(seed)
+
+    level = create_level(screen, batch_enemies=batch_enemies)
+    input_source = ScriptedInput(script)
+    level.player.max_hp = level.player.hp = float("inf")  # Keep the run going
+    if not waves:
+        level.wave_manager.wave_in_progress = False
+    spawn_enemies(level, enemy_count)
+
+    # "update" is the frame's simulation steps, "render" is everything else
+    update_time = 0.0
+    simulate = level.update
+
+    def timed_update(step):
+        nonlocal update_time
+        start = time.perf_counter()
+        simulate(step)
+        update_time += time.perf_counter() - start
+
+    level.update = timed_update
+
+    run_level(level, input_source, WARMUP_FRAMES, dt, on_frame)
+
+    update_samples, render_samples, frame_samples, entity_counts = [], [], [], []
+
+    for frame in range(frames):
+        if on_frame:
+            on_frame(level, frame)
+        update_time = 0.0
+        start = time.perf_counter()
+        run_level(level, input_source, 1, dt)
+        frame_time = time.perf_counter() - start
+        update_samples.append(update_time)
+        render_samples.append(frame_time - update_time)
+        frame_samples.append(frame_time)
+        entity_counts.append(len(level.entity_manager.entities))
+
+    return {
+        "frames": frames,
+        "dt": dt,
+        "update_ms": summarize(update_samples),
+        "render_ms": summarize(render_samples),
+        "frame_ms": summarize(frame_samples),
+        "entities_mean": sum(entity_counts) / len(entity_counts),
+        "entities_max": max(entity_counts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--dt", type=float, default=FIXED_DT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--batch-enemies",
+        action="store_true",
+        help="Move enemies with the vectorized NumPy backend",
+    )
+    args = parser.parse_args()
+
+    screen = create_screen()
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        result = run_scenario(
+            screen, name, args.frames, args.dt, args.seed, args.batch_enemies
+        )
+        results["scenarios"][name] = result
+        print(
+            f"{name:>18}: update p50 {result['update_ms']['p50']:.2f} ms "
+            f"p99 {result['update_ms']['p99']:.2f} ms, "
+            f"render p50 {result['render_ms']['p50']:.2f} ms "
+            f"p99 {result['render_ms']['p99']:.2f} ms"
+        )
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+    print(f"Wrote {args.output}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
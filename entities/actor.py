@@ -3,6 +3,9 @@ from abc import ABC, abstractmethod
 from entities.damage_number import DamageNumber
 from entities.entity import Entity
 from entities.explosion import Explosion
+from systems.asset_manager import asset_manager
+from systems.render_context import RenderContext
+from systems.sprite_cache import flash_fills, sprite_cache
 from tags.tags import Tag
 
 
@@ -39,45 +42,60 @@ class Actor(Entity, ABC):
         )
 
         self.collision_radius = 40
+        # Actors sharing a tag (teammates, a shooter and its bullets) never collide
+        # unless a subclass opts in
+        self.collide_with_shared_tags = False
+        # Fast movers test the whole path covered each step, so they cannot skip
+        # past a target between two steps
+        self.swept_collision = False
+        self.sweep_start = pygame.Vector2()  # Position before this step's move
         self.hp = 100
         self.max_hp = 100
         self.dmg = 10
 
         self.look_direction = pygame.Vector2(1, 0)  # Direction the actor is facing
 
+        self.sprite_path = None
         self.original_sprite = None
         self.sprite = None
         self.sprite_size = 80
 
+    def reset_state(self, initial_pos: pygame.Vector2):
+        """Restore per-life state so a pooled actor can be reused"""
+        self.pos.update(initial_pos)
+        self.velocity.update(0, 0)
+        self.damage_flash_timer = 0
+        self.invulnerable = False
+        self.invulnerable_timer = 0.0
+        self.hp = self.max_hp
+        self.lifetime = -1
+        self.tags.clear()
+
     def load_sprite(self, sprite_path: str, size: int = None):
-        """Load and scale a sprite for this actor"""
+        """Load and scale a sprite for this actor through the shared asset cache"""
         if size:
             self.sprite_size = size
-        self.original_sprite = pygame.image.load(sprite_path).convert_alpha()
-        self.sprite = pygame.transform.scale(
-            self.original_sprite, (self.sprite_size, self.sprite_size)
+        self.sprite_path = sprite_path
+        self.original_sprite = asset_manager.load_image(sprite_path)
+        self.sprite = asset_manager.get_scaled(
+            sprite_path, (self.sprite_size, self.sprite_size)
         )
 
-    def draw_sprite_shadow(self, direction: pygame.Vector2):
-        """Draw a shadow for the sprite rotated to face the given direction"""
-        if not self.sprite:
-            return
-
-        # Rotate sprite for shadow
-        angle = pygame.math.Vector2(1, 0).angle_to(direction)
-        rotated_sprite = pygame.transform.rotate(self.sprite, -angle)
-
-        # Create darkened shadow
-        shadow_surface = rotated_sprite.copy()
-        shadow_surface.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
-
-        shadow_rect = shadow_surface.get_rect(
-            center=(self.pos.x, self.pos.y + self.height)
+    def get_scaled_sprite(self, scale: tuple = (1.0, 1.0)) -> pygame.Surface | None:
+        """Sprite snapped to the nearest precomputed scale step, None when too small"""
+        if scale == (1.0, 1.0) or not self.sprite_path:
+            return self.sprite
+        return asset_manager.get_scale_step(
+            self.sprite_path, self.sprite_size, scale[0], scale[1]
         )
-        self.screen.blit(shadow_surface, shadow_rect)
+
+    def draw_sprite_shadow(self, ctx: RenderContext, direction: pygame.Vector2):
+        """Draw a shadow for the sprite rotated to face the given direction"""
+        self.draw_sprite_shadow_scaled(ctx, direction)
 
     def draw_sprite(
         self,
+        ctx: RenderContext,
         direction: pygame.Vector2,
         flash_color: tuple = None,
         scale: tuple = (1.0, 1.0),
@@ -85,6 +103,7 @@ class Actor(Entity, ABC):
         """Draw the sprite rotated to face the given direction, with optional damage flash and scaling
 
         Args:
+            ctx: Render context to draw into
             direction: Direction vector the sprite should face
             flash_color: Optional RGB tuple for damage flash effect
             scale: Optional (scale_x, scale_y) tuple for sprite scaling
@@ -93,69 +112,51 @@ class Actor(Entity, ABC):
             return None
 
         # Apply scaling if needed
-        sprite_to_use = self.sprite
-        if scale != (1.0, 1.0):
-            scaled_width = int(self.sprite_size * scale[0])
-            scaled_height = int(self.sprite_size * scale[1])
-            sprite_to_use = pygame.transform.scale(
-                self.original_sprite, (scaled_width, scaled_height)
-            )
+        sprite_to_use = self.get_scaled_sprite(scale)
+        if sprite_to_use is None:
+            return None
 
         # Calculate angle from direction
         angle = pygame.math.Vector2(1, 0).angle_to(direction)
 
         # Rotate the sprite
-        rotated_sprite = pygame.transform.rotate(sprite_to_use, -angle)
-        rect = rotated_sprite.get_rect(center=(self.pos.x, self.pos.y))
+        rotated_sprite = sprite_cache.get_rotated(sprite_to_use, angle)
+        rect = rotated_sprite.get_rect(center=self.render_pos)
 
-        # Draw the normal sprite
-        self.screen.blit(rotated_sprite, rect)
-
-        # Apply flash effect if taking damage
+        # While taking damage draw the flash variant in place of the normal sprite:
+        # multiply by the flash color to keep the shape, then add half of it
         if self.damage_flash_timer > 0 and flash_color:
-            # Create a colored flash surface from the sprite
-            flash_surface = rotated_sprite.copy()
-
-            # Tint with flash color while preserving the shape
-            flash_surface.fill(
-                flash_color[:3] + (255,), special_flags=pygame.BLEND_RGB_MULT
+            fills = flash_fills(
+                flash_color,
+                (flash_color[0] // 2, flash_color[1] // 2, flash_color[2] // 2),
             )
-            # Then add color tint
-            tint = (flash_color[0] // 2, flash_color[1] // 2, flash_color[2] // 2, 0)
-            flash_surface.fill(tint, special_flags=pygame.BLEND_RGB_ADD)
-
-            self.screen.blit(flash_surface, rect)
+            flash_surface = sprite_cache.get_filled(sprite_to_use, angle, fills)
+            ctx.blit(flash_surface, rect)
+        else:
+            ctx.blit(rotated_sprite, rect)
 
         return rotated_sprite, rect
 
     def draw_sprite_shadow_scaled(
-        self, direction: pygame.Vector2, scale: tuple = (1.0, 1.0)
+        self, ctx: RenderContext, direction: pygame.Vector2, scale: tuple = (1.0, 1.0)
     ):
         """Draw a shadow for the sprite with optional scaling"""
         if not self.sprite:
             return
 
         # Apply scaling if needed
-        sprite_to_use = self.sprite
-        if scale != (1.0, 1.0):
-            scaled_width = int(self.sprite_size * scale[0])
-            scaled_height = int(self.sprite_size * scale[1])
-            sprite_to_use = pygame.transform.scale(
-                self.original_sprite, (scaled_width, scaled_height)
-            )
+        sprite_to_use = self.get_scaled_sprite(scale)
+        if sprite_to_use is None:
+            return
 
-        # Rotate sprite for shadow
+        # Cached darkened silhouette of the rotated sprite
         angle = pygame.math.Vector2(1, 0).angle_to(direction)
-        rotated_sprite = pygame.transform.rotate(sprite_to_use, -angle)
-
-        # Create darkened shadow
-        shadow_surface = rotated_sprite.copy()
-        shadow_surface.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        shadow_surface = sprite_cache.get_shadow(sprite_to_use, angle)
 
         shadow_rect = shadow_surface.get_rect(
-            center=(self.pos.x, self.pos.y + self.height)
+            center=(self.render_pos.x, self.render_pos.y + self.height)
         )
-        self.screen.blit(shadow_surface, shadow_rect)
+        ctx.blit(shadow_surface, shadow_rect)
 
     def update_look_direction_from_velocity(self):
         """Update look_direction to face the direction of movement"""
@@ -179,11 +180,11 @@ class Actor(Entity, ABC):
         return normal_color
 
     @abstractmethod
-    def draw(self):
+    def draw(self, ctx: RenderContext):
         pass
 
     @abstractmethod
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         """Each actor must implement their own shadow drawing for performance"""
         pass
 
@@ -232,10 +233,7 @@ class Actor(Entity, ABC):
         pass
 
     def update(self, dt: float):
-        self.draw_shadow()  # Draw shadow first
-        self.draw()  # Then draw actor on top
-
-        # If paused, skip all game logic but keep drawing
+        # If paused, skip all game logic, the entity manager keeps drawing
         if self.entity_manager.paused:
             return
 
@@ -243,6 +241,8 @@ class Actor(Entity, ABC):
         if self.damage_flash_timer > 0:
             self.damage_flash_timer -= dt
 
+        if self.swept_collision:
+            self.sweep_start.update(self.pos)
         self.move(dt)
 
         # Update invulnerability timer
@@ -252,18 +252,66 @@ class Actor(Entity, ABC):
                 self.invulnerable = False
                 self.invulnerable_timer = 0
 
-        # Check collisions with all other entities
+        # Check collisions against nearby actors only
         if self.entity_manager:
-            for entity in self.entity_manager.entities:
-                if entity != self and isinstance(entity, Actor):
-                    if self.check_collision(entity):
-                        self.on_collision(entity)
+            self.entity_manager.spatial_hash.update(self)
+            if self.swept_collision:
+                self.resolve_swept_collisions()
+            else:
+                self.resolve_collisions()
+
+    def resolve_collisions(self):
+        """Run check_collision and on_collision against broadphase candidates"""
+        tags = self.tags
+        for entity in self.entity_manager.get_collision_candidates(self):
+            if not self.alive:
+                break
+            if entity is self or not entity.alive:
+                continue
+            if not self.collide_with_shared_tags and tags.overlaps(entity.tags):
+                continue
+            if self.check_collision(entity):
+                self.on_collision(entity)
+
+    def resolve_swept_collisions(self):
+        """Collide along the segment moved this step, earliest contact first
+
+        The actor is put back where it first touched something before its
+        on_collision calls, so hits land where they happened.
+        """
+        start = self.sweep_start
+        path = self.pos - start
+        reach = path.length() / 2 + self.collision_radius
+        candidates = self.entity_manager.spatial_hash.query(start + path / 2, reach)
+
+        tags = self.tags
+        hits = []
+        for entity in candidates:
+            if entity is self or not entity.alive:
+                continue
+            if not self.collide_with_shared_tags and tags.overlaps(entity.tags):
+                continue
+            t = sweep_circle(
+                start, path, entity.pos, self.collision_radius + entity.collision_radius
+            )
+            if t is not None:
+                hits.append((t, entity))
+        if not hits:
+            return
+
+        hits.sort(key=lambda hit: hit[0])
+        self.pos.update(start + path * hits[0][0])
+        self.entity_manager.spatial_hash.update(self)
+        for _, entity in hits:
+            if not self.alive:
+                break
+            if entity.alive:
+                self.on_collision(entity)
 
     def die(self):
         self.hp = 0
         self.entity_manager.sound_manager.play_sound("explosion")
-        explosion = Explosion([Tag.PLAYER], self.screen, self.pos.copy())
-        self.entity_manager.instantiate(explosion)
+        self.entity_manager.spawn(Explosion, [Tag.PLAYER], self.screen, self.pos.copy())
 
         # Trigger camera shake on death/explosion
         if self.entity_manager.camera:
@@ -273,8 +321,7 @@ class Actor(Entity, ABC):
             # Increase score for enemy death
             score = 100
             self.entity_manager.score += score
-            damage_number = DamageNumber(self.screen, self.pos.copy(), score)
-            self.entity_manager.instantiate(damage_number)
+            self.entity_manager.spawn(DamageNumber, self.screen, self.pos.copy(), score)
 
         self.entity_manager.destroy(self)
 
@@ -310,3 +357,29 @@ class Actor(Entity, ABC):
             return
 
         self.entity_manager.sound_manager.play_sound("hit")
+
+
+def sweep_circle(
+    start: pygame.Vector2,
+    path: pygame.Vector2,
+    center: pygame.Vector2,
+    radius: float,
+) -> float | None:
+    """Fraction along path where a point moving from start first comes within
+    radius of center, or None if it never does"""
+    offset_x = start.x - center.x
+    offset_y = start.y - center.y
+    c = offset_x * offset_x + offset_y * offset_y - radius * radius
+    if c < 0:
+        return 0.0  # Already touching at the start
+    a = path.x * path.x + path.y * path.y
+    if a == 0:
+        return None
+    b = 2 * (offset_x * path.x + offset_y * path.y)
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+    t = (-b - discriminant**0.5) / (2 * a)
+    if 0 <= t <= 1:
+        return t
+    return None
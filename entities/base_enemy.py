@@ -2,12 +2,17 @@ import pygame
 import random
 from abc import abstractmethod
 from entities.actor import Actor
+from systems.render_context import RenderContext
+from systems.sprite_cache import flash_fills, sprite_cache, tint_fills
 from tags.tags import Tag
 
 
 class BaseEnemy(Actor):
     """Base class for all enemy types with shared grow animation and rendering"""
 
+    steering = None  # Steering kind an EnemyBatch runs for this class, if any
+    cull_radius = 100  # Largest rotated sprite plus its shadow offset
+
     def __init__(self, screen: pygame.Surface, initial_pos: pygame.Vector2):
         super().__init__(screen, initial_pos)
         self.layer = 2
@@ -22,6 +27,7 @@ class BaseEnemy(Actor):
         self.is_growing = True
         self.tags.append(Tag.ENEMY)
         self.velocity = pygame.Vector2(0, 0)
+        self.batch_index = None  # Row in the entity manager's EnemyBatch, if batched
 
         # Scale HP based on size (60 size = 60 HP, 80 size = 100 HP, 100 size = 150 HP)
         # Using a formula: HP scales from 60 to 150 as size goes from 60 to 100
@@ -59,15 +65,16 @@ class BaseEnemy(Actor):
             self.pos.x = max(half_size, min(self.pos.x, screen_width - half_size))
             self.pos.y = max(half_size, min(self.pos.y, screen_height - half_size))
 
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         """Draw shadow with growth scaling"""
         scale = self.get_growth_scale()
-        self.draw_sprite_shadow_scaled(self.look_direction, scale=(scale, scale))
+        self.draw_sprite_shadow_scaled(ctx, self.look_direction, scale=(scale, scale))
 
-    def draw_sprite_with_color(self, color_tint: tuple = None):
+    def draw_sprite_with_color(self, ctx: RenderContext, color_tint: tuple = None):
         """Draw sprite with optional color modulation and growth scaling
 
         Args:
+            ctx: Render context to draw into
             color_tint: Optional RGB tuple to tint the sprite (e.g., (255, 255, 100) for yellow)
         """
         scale = self.get_growth_scale()
@@ -77,42 +84,30 @@ class BaseEnemy(Actor):
             if not self.sprite:
                 return
 
-            # Apply scaling if needed
-            sprite_to_use = self.sprite
-            if scale != 1.0:
-                scaled_width = int(self.sprite_size * scale)
-                scaled_height = int(self.sprite_size * scale)
-                sprite_to_use = pygame.transform.scale(
-                    self.original_sprite, (scaled_width, scaled_height)
-                )
+            # Snap to the nearest precomputed growth step
+            sprite_to_use = self.get_scaled_sprite((scale, scale))
+            if sprite_to_use is None:
+                return
 
             # Calculate angle from direction
             angle = pygame.math.Vector2(1, 0).angle_to(self.look_direction)
 
-            # Rotate the sprite
-            rotated_sprite = pygame.transform.rotate(sprite_to_use, -angle)
-
-            # Create color-tinted version
-            tinted_sprite = rotated_sprite.copy()
-            tinted_sprite.fill(color_tint + (255,), special_flags=pygame.BLEND_RGB_MULT)
+            # Color-tinted variant, with the red damage flash baked in while hit
+            fills = tint_fills(color_tint)
+            if self.damage_flash_timer > 0:
+                fills += flash_fills((255, 100, 100), (150, 0, 0))
 
-            rect = tinted_sprite.get_rect(center=(self.pos.x, self.pos.y))
-            self.screen.blit(tinted_sprite, rect)
+            tinted_sprite = sprite_cache.get_filled(sprite_to_use, angle, fills)
 
-            # Apply flash effect if taking damage - red flash overlay
-            if self.damage_flash_timer > 0:
-                flash_surface = tinted_sprite.copy()
-                # Tint red while preserving the shape
-                flash_surface.fill(
-                    (255, 100, 100, 255), special_flags=pygame.BLEND_RGB_MULT
-                )
-                # Then add red tint
-                flash_surface.fill((150, 0, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
-                self.screen.blit(flash_surface, rect)
+            rect = tinted_sprite.get_rect(center=self.render_pos)
+            ctx.blit(tinted_sprite, rect)
         else:
             # Use standard draw with flash color
             self.draw_sprite(
-                self.look_direction, flash_color=(255, 100, 100), scale=(scale, scale)
+                ctx,
+                self.look_direction,
+                flash_color=(255, 100, 100),
+                scale=(scale, scale),
             )
 
     @abstractmethod
@@ -120,8 +115,17 @@ class BaseEnemy(Actor):
         """Calculate acceleration for this frame - must be implemented by subclasses"""
         pass
 
+    def save_previous_state(self):
+        # A batch saves the previous position itself before moving its rows
+        if self.batch_index is None:
+            super().save_previous_state()
+
     def move(self, dt: float):
         """Shared movement logic - subclasses override calculate_acceleration"""
+        # Batched enemies were already moved this step
+        if self.batch_index is not None:
+            return
+
         # Handle growth animation
         self.update_growth(dt)
 
@@ -147,7 +151,7 @@ class BaseEnemy(Actor):
     def on_collision(self, other: Actor):
         """Standard collision behavior for all enemies"""
         # Don't collide with entities that share the same tags
-        if any(tag in other.tags for tag in self.tags):
+        if self.tags.overlaps(other.tags):
             return
 
         other.take_damage(self.dmg, self.pos)
@@ -1,6 +1,7 @@
 from entities.static import Static
 import pygame
 
+from systems.render_context import RenderContext
 from tags.tags import Tag
 
 
@@ -20,7 +21,7 @@ class Blast(Static):
         self.max_size = max_size
         self.size = 0  # Start at size 0
         self.grow_time = grow_time  # Time to reach max size
-        self.damaged_entities = set()  # Track which entities we've already damaged
+        self.damaged_ids: set[int] = set()  # IDs of entities already damaged
 
     def update(self, dt: float):
         super().update(dt)
@@ -33,45 +34,36 @@ class Blast(Static):
                 self.size = self.max_size
                 self.on_expire()
 
-        # Check for collisions with enemies to apply damage
-        if self.entity_manager:
-            for entity in self.entity_manager.entities:
-                if (
-                    entity not in self.damaged_entities
-                    and hasattr(entity, "take_damage")
-                    and Tag.ENEMY in entity.tags
-                ):
-                    distance = (entity.pos - self.pos).length()
-                    if distance < (self.size / 2 + entity.collision_radius):
-                        entity.take_damage(1000)  # Apply damage
-                        self.damaged_entities.add(entity)  # Mark as damaged
-
-    def draw(self):
-        # Draw explosion as a opaque white circle
-        explosion_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(
-            explosion_surface,
-            (255, 255, 255, 255),  # White with full opacity
-            (self.size / 2, self.size / 2),
+        # Damage enemies the blast reaches that it has not hit yet
+        for entity in self.entity_manager.query_radius(
+            self.pos,
             self.size / 2,
-        )
-        self.screen.blit(
-            explosion_surface,
-            (self.pos.x - self.size / 2, self.pos.y - self.size / 2),
-        )
+            Tag.ENEMY,
+            exclude_ids=self.damaged_ids,
+            include_collision_radius=True,
+        ):
+            entity.take_damage(1000)  # Apply damage
+            self.damaged_ids.add(entity.entity_id)  # Mark as damaged
 
-    def draw_shadow(self):
-        # Draw shadow as a opaque black circle
-        shadow_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(
-            shadow_surface,
-            (0, 0, 0, 255),  # Black with full opacity
-            (self.size / 2, self.size / 2),
-            self.size / 2,
+    def draw(self, ctx: RenderContext):
+        # Draw explosion as an opaque white circle straight onto the target.
+        # pygame.draw clips to the target, so the cost is bounded by its size
+        # rather than by the blast radius
+        ctx.mark(
+            pygame.draw.circle(
+                ctx.surface, (255, 255, 255), self.render_pos, self.size / 2
+            )
         )
-        self.screen.blit(
-            shadow_surface,
-            (self.pos.x - self.size / 2, self.pos.y - self.size / 2 + 10),
+
+    def draw_shadow(self, ctx: RenderContext):
+        # Draw shadow as an opaque black circle
+        ctx.mark(
+            pygame.draw.circle(
+                ctx.surface,
+                (0, 0, 0),
+                (self.render_pos.x, self.render_pos.y + 10),
+                self.size / 2,
+            )
         )
 
     def move(self, dt: float):
@@ -1,9 +1,13 @@
 import pygame
 from entities.actor import Actor
+from systems.render_context import RenderContext
 from tags.tags import Tag
 
 
 class Bullet(Actor):
+    cull_radius = 90  # Rotated sprite plus its shadow offset
+    out_of_bounds_margin = 100
+
     def __init__(
         self,
         owner_tags: Tag,
@@ -13,33 +17,51 @@ class Bullet(Actor):
         dmg: float = 25,
     ):
         super().__init__(screen, initial_pos)
-        self.direction = direction.normalize()
-        self.lifetime = 2.0
-        self.dmg = dmg
-        self.tags.append(Tag.BULLET)
         self.max_speed = 1500  # Bullets are fast
+        self.swept_collision = True  # Can move further than a target's size per step
 
         # Load sprite using the base class method
         self.load_sprite("assets/sprites/bullet.png", 80)
 
         # Dimensions
-        self.width = 70
         self.original_width = 70
-        self.bullet_height = 35
         self.original_height = 35
 
+        # Animation settings
+        self.shrink_duration = 0.05
+
+        self.direction = pygame.Vector2(1, 0)
+        self.reset(owner_tags, screen, initial_pos, direction, dmg)
+
+    def reset(
+        self,
+        owner_tags: Tag,
+        screen: pygame.Surface,
+        initial_pos: pygame.Vector2,
+        direction: pygame.Vector2 = pygame.Vector2(1, 0),
+        dmg: float = 25,
+    ):
+        """Restore a pooled bullet to a freshly fired state"""
+        self.reset_state(initial_pos)
+        self.screen = screen
+        self.direction.update(direction)
+        self.direction.normalize_ip()
+        self.lifetime = 2.0
+        self.dmg = dmg
+        self.tags.append(Tag.BULLET)
+        self.tags.update(owner_tags)
+
+        # Dimensions
+        self.width = self.original_width
+        self.bullet_height = self.original_height
+
         # Animation state
         self.is_shrinking = False
-        self.shrink_duration = 0.05
         self.shrink_timer = 0
 
         # Collision state
         self.has_dealt_damage = False
 
-        for tag in owner_tags:
-            if tag not in self.tags:
-                self.tags.append(tag)
-
     def _update_shrink_animation(self, dt: float):
         """Update the shrink animation and return True if animation is complete"""
         self.shrink_timer += dt
@@ -60,21 +82,21 @@ class Bullet(Actor):
             self.is_shrinking = True
             self.shrink_timer = 0
 
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         # Calculate scale based on shrink animation
         scale_x = self.width / self.original_width
         scale_y = self.bullet_height / self.original_height
 
         # Use the base class sprite shadow method with scaling
-        self.draw_sprite_shadow_scaled(self.direction, scale=(scale_x, scale_y))
+        self.draw_sprite_shadow_scaled(ctx, self.direction, scale=(scale_x, scale_y))
 
-    def draw(self):
+    def draw(self, ctx: RenderContext):
         # Calculate scale based on shrink animation
         scale_x = self.width / self.original_width
         scale_y = self.bullet_height / self.original_height
 
         # Use the base class sprite drawing method with scaling
-        self.draw_sprite(self.direction, scale=(scale_x, scale_y))
+        self.draw_sprite(ctx, self.direction, scale=(scale_x, scale_y))
 
     def move(self, dt: float):
         # Handle shrinking animation
@@ -89,7 +111,7 @@ class Bullet(Actor):
 
     def on_collision(self, other: Actor):
         # Don't collide with entities that share the same tags
-        if any(tag in other.tags for tag in self.tags):
+        if self.tags.overlaps(other.tags):
             return
 
         # Deal damage once
@@ -1,6 +1,8 @@
 import pygame
 
 from entities.static import Static
+from systems.asset_manager import asset_manager
+from systems.render_context import RenderContext
 
 
 class Cursor(Static):
@@ -11,43 +13,44 @@ class Cursor(Static):
         self.layer = 4
         self.size = 80
         self.skip_auto_draw = (
-            True  # Don't draw during entity update, draw manually at the end
-        )
-        self.original_sprite = pygame.image.load(
-            "assets/sprites/cursor_sprite.png"
-        ).convert_alpha()
-        self.sprite = pygame.transform.scale(
-            self.original_sprite, (self.size, self.size)
+            True  # Not drawn by the entity manager, the level draws it last
         )
+        self.interpolated = False  # Follows the mouse every rendered frame
+        self.sprite_path = "assets/sprites/cursor_sprite.png"
+        self.original_sprite = asset_manager.load_image(self.sprite_path)
+        self.sprite = asset_manager.get_scaled(self.sprite_path, (self.size, self.size))
 
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         # Scale shadow with cursor
-        shadow_sprite = pygame.transform.scale(
-            self.original_sprite, (self.size, self.size)
+        shadow_sprite = asset_manager.get_scaled(
+            self.sprite_path, (self.size, self.size)
         )
         shadow_rect = shadow_sprite.get_rect(
-            center=(self.pos.x, self.pos.y + self.height)
+            center=(self.render_pos.x, self.render_pos.y + self.height)
         )
 
         # Create a darkened version for shadow
         shadow_surface = shadow_sprite.copy()
         shadow_surface.fill((0, 0, 0, 180), special_flags=pygame.BLEND_RGBA_MULT)
 
-        self.screen.blit(shadow_surface, shadow_rect)
+        ctx.blit(shadow_surface, shadow_rect)
 
-    def draw(self):
-        rect = self.sprite.get_rect(center=(self.pos.x, self.pos.y))
-        self.screen.blit(self.sprite, rect)
+    def draw(self, ctx: RenderContext):
+        rect = self.sprite.get_rect(center=self.render_pos)
+        ctx.blit(self.sprite, rect)
 
     def move(self, dt: float):
-        mouse_pos = pygame.mouse.get_pos()
+        self.follow_input()
+
+    def follow_input(self):
+        """Snap to the mouse and pick the pressed or released size"""
+        mouse_pos = self.entity_manager.input.mouse_pos()
         self.pos = pygame.Vector2(mouse_pos[0], mouse_pos[1])
 
-        if pygame.mouse.get_pressed()[0]:
+        if self.entity_manager.input.mouse_pressed(0):
             self.size = 70
         else:
             self.size = 80
 
-        self.sprite = pygame.transform.scale(
-            self.original_sprite, (self.size, self.size)
-        )
+        self.sprite = asset_manager.get_scaled(self.sprite_path, (self.size, self.size))
+        self.render_pos.update(self.pos)
@@ -1,17 +1,28 @@
 import pygame
 
 from entities.static import Static
+from systems.render_context import RenderContext
+from systems.text_renderer import text_renderer
 
 
 class DamageNumber(Static):
+    cull_radius = 60
+
     def __init__(self, screen, pos, damage_amount):
         super().__init__(screen, pos)
-        self.damage_amount = damage_amount
-        self.lifetime = 1.0  # seconds
-        self.elapsed_time = 0.0
         self.velocity = pygame.Vector2(0, -50)  # Move upwards
         self.layer = 10
         self.height = 5
+        self.reset(screen, pos, damage_amount)
+
+    def reset(self, screen, pos, damage_amount):
+        """Restore a pooled damage number to its starting state"""
+        self.screen = screen
+        self.pos.update(pos)
+        self.damage_amount = damage_amount
+        self.text = str(damage_amount)
+        self.lifetime = 1.0  # seconds
+        self.elapsed_time = 0.0
 
     def move(self, delta_time):
         self.elapsed_time += delta_time
@@ -22,17 +33,21 @@ class DamageNumber(Static):
         # Update position
         self.pos += self.velocity * delta_time
 
-    def draw(self):
-        font = pygame.font.SysFont("Arial", 32, True)
-        text_surface = font.render(str(self.damage_amount), True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-        self.screen.blit(text_surface, text_rect)
+    def draw(self, ctx: RenderContext):
+        text_surface = text_renderer.render(
+            self.text, (255, 255, 255), "Arial", 32, bold=True
+        )
+        text_rect = text_surface.get_rect(
+            center=(int(self.render_pos.x), int(self.render_pos.y))
+        )
+        ctx.blit(text_surface, text_rect)
 
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         # Shadows for damage numbers can be simple offsets
-        font = pygame.font.SysFont("Arial", 32, True)
-        text_surface = font.render(str(self.damage_amount), True, (0, 0, 0))
+        text_surface = text_renderer.render(
+            self.text, (0, 0, 0), "Arial", 32, bold=True
+        )
         text_rect = text_surface.get_rect(
-            center=(int(self.pos.x), int(self.pos.y + self.height))
+            center=(int(self.render_pos.x), int(self.render_pos.y + self.height))
         )
-        self.screen.blit(text_surface, text_rect)
+        ctx.blit(text_surface, text_rect)
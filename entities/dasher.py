@@ -1,10 +1,14 @@
 import pygame
 from entities.base_enemy import BaseEnemy
+from systems.render_context import RenderContext
 
 
 class Dasher(BaseEnemy):
     """Enemy that telegraphs a line then dashes toward the player once"""
 
+    steering = "dash"  # Steering kind when moved by an EnemyBatch
+    cull_radius = None  # The telegraph line reaches across the screen
+
     def __init__(self, screen: pygame.Surface, initial_pos: pygame.Vector2):
         super().__init__(screen, initial_pos)
         self.max_speed = 1000
@@ -19,19 +23,21 @@ class Dasher(BaseEnemy):
         self.line_start = None
         self.line_end = None
 
-    def draw(self):
+    def draw(self, ctx: RenderContext):
         """Draw dasher with cyan color and telegraph line"""
         # Draw telegraph line if haven't dashed yet
         if not self.has_dashed and self.line_start and self.line_end:
-            line_surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            # The line is opaque, so it is drawn straight onto the target and
+            # only the pixels inside its clipped bounding box are touched
             line_color = (255, 0, 0)  # Red color
-            pygame.draw.line(
-                line_surface, line_color, self.line_start, self.line_end, 20
+            ctx.mark(
+                pygame.draw.line(
+                    ctx.surface, line_color, self.line_start, self.line_end, 20
+                )
             )
-            self.screen.blit(line_surface, (0, 0))
 
         # Draw sprite with cyan tint
-        self.draw_sprite_with_color(color_tint=(100, 255, 255))
+        self.draw_sprite_with_color(ctx, color_tint=(100, 255, 255))
 
     def calculate_acceleration(self, dt: float) -> pygame.Vector2:
         """Telegraph, dash once toward player, then chase normally"""
@@ -40,19 +46,10 @@ class Dasher(BaseEnemy):
             return pygame.Vector2(0, 0)
 
         # Find player
-        from entities.player import Player
-
-        players = [
-            entity
-            for entity in self.entity_manager.entities
-            if isinstance(entity, Player)
-        ]
-
-        if not players:
+        player = self.entity_manager.get_player()
+        if player is None:
             return pygame.Vector2(0, 0)
 
-        player = players[0]
-
         # If haven't dashed yet, telegraph
         if not self.has_dashed:
             self.telegraph_timer += dt
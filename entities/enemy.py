@@ -1,32 +1,24 @@
 import pygame
 from entities.base_enemy import BaseEnemy
-from entities.actor import Actor
-from tags.tags import Tag
+from systems.render_context import RenderContext
 
 
 class Enemy(BaseEnemy):
     """Standard enemy that chases the player"""
 
+    steering = "chase"  # Steering kind when moved by an EnemyBatch
+
     def __init__(self, screen: pygame.Surface, initial_pos: pygame.Vector2):
         super().__init__(screen, initial_pos)
         self.max_speed = 150
         self.acceleration = 1000
 
-    def draw(self):
-        self.draw_sprite_with_color()
+    def draw(self, ctx: RenderContext):
+        self.draw_sprite_with_color(ctx)
 
     def calculate_acceleration(self, dt: float) -> pygame.Vector2:
         # Find the player
-        player = None
-        if self.entity_manager:
-            for entity in self.entity_manager.entities:
-                if (
-                    isinstance(entity, Actor)
-                    and Tag.PLAYER in entity.tags
-                    and Tag.BULLET not in entity.tags
-                ):
-                    player = entity
-                    break
+        player = self.entity_manager.get_player() if self.entity_manager else None
 
         # Don't chase while growing
         accel = pygame.Vector2(0, 0)
@@ -1,13 +1,39 @@
 from abc import ABC, abstractmethod
 
-from tags.tags import Tag
+import pygame
+
+from tags.tags import TagSet
 
 
 class Entity(ABC):
+    # How far from pos draw and draw_shadow can reach, None to draw even off screen
+    cull_radius: float | None = None
+    # Despawn once this far outside the arena, None to never despawn for it
+    out_of_bounds_margin: float | None = None
+
     def __init__(self):
-        self.tags = []
+        self.tags = TagSet()
         self.entity_manager = None
         self.lifetime = -1
+        self.alive = False  # True while the entity is in play in an EntityManager
+        self.entity_id = 0  # Unique per instantiation, issued by the EntityManager
+        self.interpolated = True  # Draw between the last two sim states
+        self.prev_pos = pygame.Vector2()  # Position before the latest sim step
+        self.render_pos = pygame.Vector2()  # Position to draw at this frame
+
+    def save_previous_state(self):
+        """Remember the simulated position before a step"""
+        self.prev_pos.update(self.pos)
+
+    def interpolate(self, alpha: float):
+        """Set render_pos alpha of the way from the previous to the current position"""
+        if self.interpolated:
+            self.render_pos.update(
+                self.prev_pos.x + (self.pos.x - self.prev_pos.x) * alpha,
+                self.prev_pos.y + (self.pos.y - self.prev_pos.y) * alpha,
+            )
+        else:
+            self.render_pos.update(self.pos)
 
     @abstractmethod
     def update(self, dt: float):
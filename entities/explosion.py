@@ -1,11 +1,22 @@
 import pygame
 import random
 from entities.static import Static
+from systems.particle_system import ParticleSystem, grow_shrink_curve
+from systems.render_context import RenderContext
 from tags.tags import Tag
 import math
 
+SECONDARY_COLOR = pygame.Color("orange")
+
+
+def debris_system(capacity: int = 1024) -> ParticleSystem:
+    """Particle system for secondary explosions, growing and shrinking like the main one"""
+    return ParticleSystem(capacity, grow_shrink_curve(0.2))
+
 
 class Explosion(Static):
+    cull_radius = 150  # Largest main circle plus its shadow offset
+
     def __init__(
         self,
         owner_tags: Tag,
@@ -14,24 +25,34 @@ class Explosion(Static):
         dmg: float = 100,
     ):
         super().__init__(screen, initial_pos)
-        self.lifetime = 0.5  # Explosions last 0.5 second by default
-        self.initial_lifetime = 0.5  # Store initial lifetime
-        self.dmg = dmg
+        self.initial_lifetime = 0.5  # Explosions last 0.5 second by default
         self.max_size = 250
-        self.size = 0  # Start at size 0
         self.grow_time = 0.1  # Time to reach max size
-        self.damaged_entities = set()  # Track which entities we've already damaged
+        self.damaged_ids: set[int] = set()  # IDs of entities already damaged
+        self.reset(owner_tags, screen, initial_pos, dmg)
 
-        # Secondary explosions - random number between 1 and 3
-        self.secondary_explosions = self._create_secondary_explosions(initial_pos)
+    def reset(
+        self,
+        owner_tags: Tag,
+        screen: pygame.Surface,
+        initial_pos: pygame.Vector2,
+        dmg: float = 100,
+    ):
+        """Restore a pooled explosion to its starting state"""
+        self.screen = screen
+        self.pos.update(initial_pos)
+        self.lifetime = self.initial_lifetime
+        self.dmg = dmg
+        self.size = 0  # Start at size 0
+        self.damaged_ids.clear()
+
+        self.debris_emitted = False  # Secondary explosions go out on the first step
 
-        for tag in owner_tags:
-            if tag not in self.tags:  # Avoid duplicates
-                self.tags.append(tag)
+        self.tags.clear()
+        self.tags.update(owner_tags)
 
-    def _create_secondary_explosions(self, initial_pos):
-        """Create secondary explosions around the main explosion"""
-        secondary_explosions = []
+    def _emit_secondary_explosions(self, debris: ParticleSystem):
+        """Emit 1-3 delayed secondary explosions around the main one as debris particles"""
         num_secondary = random.randint(1, 3)
 
         # Distribute angles evenly around the circle
@@ -45,74 +66,34 @@ class Explosion(Static):
             rad = math.radians(angle)
             distance = self.max_size * random.uniform(0.25, 0.4)  # Vary the distance
 
-            offset_x = math.cos(rad) * distance
-            offset_y = math.sin(rad) * distance
-
-            secondary_explosions.append(
-                {
-                    "pos": pygame.Vector2(
-                        initial_pos.x + offset_x, initial_pos.y + offset_y
-                    ),
-                    "max_size": self.max_size * random.uniform(0.4, 0.6),  # Vary size
-                    "size": 0,
-                    "delay": random.uniform(0.05, 0.15),  # Slight delay
-                }
+            debris.emit(
+                (
+                    self.pos.x + math.cos(rad) * distance,
+                    self.pos.y + math.sin(rad) * distance,
+                ),
+                self.max_size * random.uniform(0.4, 0.6),  # Vary size
+                self.initial_lifetime,
+                SECONDARY_COLOR,
+                delay=random.uniform(0.05, 0.15),  # Slight delay
             )
 
-        return secondary_explosions
-
-    def _update_secondary_explosion_size(self, secondary, time_elapsed):
-        """Update the size of a secondary explosion based on elapsed time"""
-        if time_elapsed > secondary["delay"]:
-            adjusted_time = time_elapsed - secondary["delay"]
-            if adjusted_time < self.grow_time:
-                progress = adjusted_time / self.grow_time
-                secondary["size"] = secondary["max_size"] * progress
-            else:
-                shrink_time = self.initial_lifetime - self.grow_time
-                time_since_max = adjusted_time - self.grow_time
-                progress = time_since_max / shrink_time
-                secondary["size"] = secondary["max_size"] * (1 - progress)
-
-    def _draw_secondary_explosions(self, time_elapsed):
-        """Draw all secondary explosions"""
-        for secondary in self.secondary_explosions:
-            if time_elapsed > secondary["delay"]:
-                pygame.draw.circle(
-                    self.screen, "orange", secondary["pos"], secondary["size"] / 2
-                )
-
-    def _draw_secondary_shadows(self, time_elapsed):
-        """Draw shadows for all secondary explosions"""
-        for secondary in self.secondary_explosions:
-            if time_elapsed > secondary["delay"]:
-                pygame.draw.circle(
-                    self.screen,
-                    "black",
-                    (secondary["pos"].x, secondary["pos"].y + self.height),
-                    secondary["size"] / 2,
-                )
-
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         # Main explosion shadow
-        pygame.draw.circle(
-            self.screen, "black", (self.pos.x, self.pos.y + self.height), self.size / 2
+        ctx.mark(
+            pygame.draw.circle(
+                ctx.surface,
+                "black",
+                (self.render_pos.x, self.render_pos.y + self.height),
+                self.size / 2,
+            )
         )
 
-        # Secondary explosion shadows
-        time_elapsed = self.initial_lifetime - self.lifetime
-        self._draw_secondary_shadows(time_elapsed)
-
-    def draw(self):
+    def draw(self, ctx: RenderContext):
         # Main explosion
-        pygame.draw.circle(
-            self.screen, "yellow", (self.pos.x, self.pos.y), self.size / 2
+        ctx.mark(
+            pygame.draw.circle(ctx.surface, "yellow", self.render_pos, self.size / 2)
         )
 
-        # Secondary explosions
-        time_elapsed = self.initial_lifetime - self.lifetime
-        self._draw_secondary_explosions(time_elapsed)
-
     def move(self, dt: float):
         # Calculate how much time has passed (initial - remaining)
         time_elapsed = self.initial_lifetime - self.lifetime
@@ -130,28 +111,23 @@ class Explosion(Static):
             # Inverse progress (1 to 0)
             self.size = self.max_size * (1 - progress)
 
-        # Update secondary explosions
-        for secondary in self.secondary_explosions:
-            self._update_secondary_explosion_size(secondary, time_elapsed)
-
-        # Check collisions with all entities
-        if self.entity_manager:
-            from entities.actor import Actor
-
-            for entity in self.entity_manager.entities:
-                if entity != self and isinstance(entity, Actor):
-                    # Skip if already damaged this entity
-                    if entity in self.damaged_entities:
-                        continue
-
-                    # Check if entity is within explosion radius
-                    distance = self.pos.distance_to(entity.pos)
-                    if distance < (self.size / 2):
-                        self.on_collision(entity)
-                        self.damaged_entities.add(entity)  # Mark as damaged
+        # Secondary explosions are updated and drawn by the shared debris system
+        if not self.debris_emitted and self.entity_manager.debris is not None:
+            self._emit_secondary_explosions(self.entity_manager.debris)
+            self.debris_emitted = True
+
+        # Damage actors inside the explosion that it has not hit yet
+        for entity in self.entity_manager.query_radius(
+            self.pos,
+            self.size / 2,
+            ignore_tags=self.tags,
+            exclude_ids=self.damaged_ids,
+        ):
+            self.on_collision(entity)
+            self.damaged_ids.add(entity.entity_id)  # Mark as damaged
 
     def on_collision(self, other):
-        if any(tag in other.tags for tag in self.tags):
+        if self.tags.overlaps(other.tags):
             return
 
         other.take_damage(self.dmg, self.pos)
@@ -0,0 +1,62 @@
+import pygame
+
+from entities.static import Static
+from systems.particle_system import ParticleSystem
+from systems.render_context import RenderContext
+
+
+class ParticleEffect(Static):
+    """Updates and draws a particle system shared by many emitters, in one pass
+
+    With shadow_color None the shadows are left to a ParticleShadow, so they can sit
+    on a lower layer than the particles themselves.
+    """
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        particles: ParticleSystem,
+        layer: float = 1,
+        shadow_color=(0, 0, 0),
+    ):
+        super().__init__(screen, pygame.Vector2(0, 0))
+        self.particles = particles
+        self.layer = layer
+        self.shadow_color = shadow_color
+        self.interpolated = False  # Particles are stored in world coordinates
+
+    def move(self, dt: float):
+        self.particles.update(dt)
+
+    def draw(self, ctx: RenderContext):
+        self.particles.draw(ctx)
+
+    def draw_shadow(self, ctx: RenderContext):
+        if self.shadow_color is not None:
+            self.particles.draw(ctx, self.shadow_color, self.height)
+
+
+class ParticleShadow(Static):
+    """Draws only the shadows of a particle system updated by a ParticleEffect"""
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        particles: ParticleSystem,
+        layer: float = 1,
+        shadow_color=(0, 0, 0),
+    ):
+        super().__init__(screen, pygame.Vector2(0, 0))
+        self.particles = particles
+        self.layer = layer
+        self.shadow_color = shadow_color
+        self.interpolated = False
+
+    def move(self, dt: float):
+        pass
+
+    def draw(self, ctx: RenderContext):
+        pass
+
+    def draw_shadow(self, ctx: RenderContext):
+        self.particles.draw(ctx, self.shadow_color, self.height)
@@ -3,6 +3,8 @@ import random
 from entities.actor import Actor
 from entities.blast import Blast
 from entities.bullet import Bullet
+from systems.particle_system import ParticleSystem, trail_size_curve
+from systems.render_context import RenderContext
 from tags.tags import Tag
 
 
@@ -28,79 +30,39 @@ class Player(Actor):
         self.load_sprite("assets/sprites/ship_sprite.png", self.size)
 
         # Trail effect
-        self.trail_particles = []
+        self.trail = ParticleSystem(capacity=64, size_curve=trail_size_curve)
         self.trail_spawn_timer = 0
         self.trail_spawn_interval = 0.01  # Spawn trail particle every 0.03 seconds
 
-    def draw_shadow(self):
-        self.draw_sprite_shadow(self.look_direction)
-
-    def _update_trail(self, dt: float):
-        """Update trail particles"""
-        for particle in self.trail_particles[:]:
-            particle["lifetime"] -= dt
-
-            if particle["lifetime"] <= 0:
-                self.trail_particles.remove(particle)
-                continue
-
-            # Calculate size based on lifetime
-            progress = particle["lifetime"] / particle["max_lifetime"]
-            if progress > 0.9:
-                # Growing phase
-                growth = (1 - progress) * 2  # 0 to 1
-                particle["size"] = particle["max_size"] * growth
-            else:
-                # Shrinking phase
-                particle["size"] = particle["max_size"] * (progress * 2)
-
-    def _draw_trail(self):
-        """Draw trail particles"""
-        for particle in self.trail_particles:
-            if particle["size"] > 0:
-                pygame.draw.circle(
-                    self.screen,
-                    particle["color"],
-                    (int(particle["pos"].x), int(particle["pos"].y)),
-                    int(particle["size"] / 2),
-                )
+    def draw_shadow(self, ctx: RenderContext):
+        self.draw_sprite_shadow(ctx, self.look_direction)
 
     def _spawn_trail_particle(self):
-        """Spawn a new trail particle at player position"""
+        """Spawn a new trail particle behind the player"""
         # Spawn behind the player based on their movement direction
         offset = self.look_direction * -20  # 20 pixels behind
-        spawn_pos = self.pos + offset
-
-        particle = {
-            "pos": spawn_pos.copy(),
-            "size": 20,
-            "max_size": 20,
-            "lifetime": 0.5,  # Total lifetime in seconds
-            "max_lifetime": 0.5,
-            "color": (155, 255, 100),  # Light blue with some transparency
-        }
-        self.trail_particles.append(particle)
-
-    def draw(self):
+        self.trail.emit(self.pos + offset, 20, 0.5, (155, 255, 100))
+
+    def draw(self, ctx: RenderContext):
         # Draw trail first (behind the ship)
-        self._draw_trail()
+        self.trail.draw(ctx)
 
         # Use the base class sprite drawing method with red flash color
-        self.draw_sprite(self.look_direction, flash_color=(255, 100, 100))
+        self.draw_sprite(ctx, self.look_direction, flash_color=(255, 100, 100))
 
     def move(self, dt: float):
-        keys = pygame.key.get_pressed()
+        input_state = self.entity_manager.input
 
         # Calculate acceleration direction from input
         accel = pygame.Vector2(0, 0)
 
-        if keys[pygame.K_w]:
+        if input_state.key_pressed(pygame.K_w):
             accel.y -= 1
-        if keys[pygame.K_s]:
+        if input_state.key_pressed(pygame.K_s):
             accel.y += 1
-        if keys[pygame.K_a]:
+        if input_state.key_pressed(pygame.K_a):
             accel.x -= 1
-        if keys[pygame.K_d]:
+        if input_state.key_pressed(pygame.K_d):
             accel.x += 1
 
         # Apply physics (shared logic)
@@ -115,11 +77,11 @@ class Player(Actor):
         self.pos.x = max(half_size, min(self.pos.x, screen_width - half_size))
         self.pos.y = max(half_size, min(self.pos.y, screen_height - half_size))
 
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = input_state.mouse_pos()
         self.update_look_direction_to_target(pygame.Vector2(mouse_pos))
 
         # Update trail
-        self._update_trail(dt)
+        self.trail.update(dt)
 
         # Spawn trail particles while moving
         if self.velocity.length() > 10:  # Only spawn when moving
@@ -129,17 +91,17 @@ class Player(Actor):
                 self.trail_spawn_timer = 0
 
     def spawn_bullet(self, angle_offset: float, dmg: float = None):
-        bullet = Bullet(
-            self.tags.copy(),
+        self.entity_manager.spawn(
+            Bullet,
+            self.tags,
             self.screen,
             self.pos.copy(),
-            self.look_direction.copy().rotate(
+            self.look_direction.rotate(
                 angle_offset
                 + random.uniform(-self.shoot_angle_variance, self.shoot_angle_variance)
             ),
             self.dmg if dmg is None else dmg,
         )
-        self.entity_manager.instantiate(bullet)
 
     def shoot(self):
         if self.shoot_cooldown <= 0:
@@ -175,8 +137,8 @@ class Player(Actor):
         if self.blast_cooldown > 0:
             self.blast_cooldown -= dt
 
-        if pygame.mouse.get_pressed()[0]:
+        if self.entity_manager.input.mouse_pressed(0):
             self.shoot()
 
-        if pygame.key.get_pressed()[pygame.K_SPACE]:
+        if self.entity_manager.input.key_pressed(pygame.K_SPACE):
             self.super_blast()
@@ -1,6 +1,7 @@
 import pygame
 from abc import ABC, abstractmethod
 from entities.entity import Entity
+from systems.render_context import RenderContext
 
 
 class Static(Entity, ABC):
@@ -25,11 +26,11 @@ class Static(Entity, ABC):
         )
 
     @abstractmethod
-    def draw(self):
+    def draw(self, ctx: RenderContext):
         pass
 
     @abstractmethod
-    def draw_shadow(self):
+    def draw_shadow(self, ctx: RenderContext):
         pass
 
     @abstractmethod
@@ -37,11 +38,6 @@ class Static(Entity, ABC):
         pass
 
     def update(self, dt: float):
-        # Skip drawing if this entity will be drawn manually later (e.g., cursor on top of overlays)
-        if not getattr(self, "skip_auto_draw", False):
-            self.draw_shadow()  # Draw shadow first
-            self.draw()  # Then draw actor on top
-
         if not self.always_active and self.entity_manager.paused:
             return
 
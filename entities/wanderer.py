@@ -1,11 +1,14 @@
 import pygame
 import random
 from entities.base_enemy import BaseEnemy
+from systems.render_context import RenderContext
 
 
 class Wanderer(BaseEnemy):
     """Enemy variant that wanders randomly instead of chasing the player"""
 
+    steering = "wander"  # Steering kind when moved by an EnemyBatch
+
     def __init__(self, screen: pygame.Surface, initial_pos: pygame.Vector2):
         super().__init__(screen, initial_pos)
         self.max_speed = 100  # Slower than regular enemies
@@ -23,8 +26,8 @@ class Wanderer(BaseEnemy):
         rad = pygame.math.Vector2(1, 0).rotate(angle)
         return rad.normalize()
 
-    def draw(self):
-        self.draw_sprite_with_color(color_tint=(255, 255, 100))
+    def draw(self, ctx: RenderContext):
+        self.draw_sprite_with_color(ctx, color_tint=(255, 255, 100))
 
     def calculate_acceleration(self, dt: float) -> pygame.Vector2:
         # Don't wander while growing
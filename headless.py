@@ -0,0 +1,109 @@
+"""Run the game loop without a window or a human at the controls.
+
+Uses SDL's dummy video and audio drivers, a fixed delta time and scripted input.
+
+    python headless.py --frames 1200
+"""
+
+import argparse
+import os
+import random
+
+# The dummy drivers have to be selected before pygame initializes its display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from scenes.level import Level
+from systems.fixed_timestep import SIMULATION_STEP
+from systems.input_source import ScriptedInput
+from systems.profiler import profiler
+
+SCREEN_SIZE = (1280, 720)
+FIXED_DT = SIMULATION_STEP  # One simulation step per rendered frame
+
+
+def create_screen(size: tuple[int, int] = SCREEN_SIZE) -> pygame.Surface:
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+def circling_fire_script(frame: int) -> dict:
+    """Hold fire while sweeping the mouse around the middle of the screen"""
+    aim = pygame.Vector2(300, 0).rotate(frame * 2)
+    center = pygame.Vector2(SCREEN_SIZE) / 2
+    strafe = [pygame.K_a, pygame.K_w, pygame.K_d, pygame.K_s][(frame // 120) % 4]
+    return {
+        "keys": {strafe},
+        "mouse_pos": (int(center.x + aim.x), int(center.y + aim.y)),
+        "mouse_buttons": (True, False, False),
+    }
+
+
+def create_level(
+    screen: pygame.Surface, dirty_rects: bool = False, batch_enemies: bool = False
+) -> Level:
+    level = Level(screen, dirty_rects, batch_enemies)
+    level.setup()
+    return level
+
+
+def run_level(
+    level: Level,
+    input_source: ScriptedInput,
+    frames: int,
+    dt: float = FIXED_DT,
+    on_frame=None,
+):
+    """Advance a level a fixed number of frames, calling on_frame(level, frame)"""
+    for frame in range(frames):
+        pygame.event.pump()
+        if on_frame:
+            on_frame(level, frame)
+        level.render(dt, input_source.sample())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--dt", type=float, default=FIXED_DT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Profile the run and write a Chrome trace of the last frames to PATH",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="Update only the changed parts of the display",
+    )
+    parser.add_argument(
+        "--batch-enemies",
+        action="store_true",
+        help="Move enemies with the vectorized NumPy backend",
+    )
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    screen = create_screen()
+    level = create_level(screen, args.dirty_rects, args.batch_enemies)
+    input_source = ScriptedInput(circling_fire_script)
+    if args.profile:
+        profiler.enable()
+    run_level(level, input_source, args.frames, args.dt)
+    if args.profile:
+        profiler.export_chrome_trace(args.profile)
+        profiler.disable()
+
+    print(
+        f"Ran {args.frames} frames: wave {level.wave_manager.current_wave_index}, "
+        f"score {level.entity_manager.score}, "
+        f"{len(level.entity_manager.entities)} entities alive"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 # Example file showing a basic pygame "game loop"
+import sys
+
 import pygame
 from enum import Enum
 
@@ -7,6 +9,7 @@ from entities.enemy import Enemy
 from entities.player import Player
 from scenes.level import Level
 from systems.entity_manager import EntityManager
+from systems.input_source import PygameInput
 from systems.sound_manager import SoundManager
 from systems.wave_manager import WaveManager
 from ui.main_menu import MainMenu
@@ -16,7 +19,12 @@ pygame.init()
 screen = pygame.display.set_mode((1280, 720))
 clock = pygame.time.Clock()
 running = True
+# Redraw and present only the changed parts of the screen, for slow renderers
+dirty_rects = "--dirty-rects" in sys.argv[1:]
+# Move enemies as NumPy arrays, for very large crowds
+batch_enemies = "--batch-enemies" in sys.argv[1:]
 dt = 0  # Delta time between frames
+input_source = PygameInput(from_events=True)  # Built from the event queue below
 
 current_scene = None
 
@@ -27,14 +35,15 @@ def switch_scene(new_scene):
     current_scene.setup()
 
 
-switch_scene(MainMenu(screen, switch_scene))
+switch_scene(MainMenu(screen, switch_scene, dirty_rects, batch_enemies))
 
 while running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
+        input_source.handle_event(event)
 
-    current_scene.render(dt)
+    current_scene.render(dt, input_source.sample())
 
     dt = clock.tick(144) / 1000
 
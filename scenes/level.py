@@ -1,22 +1,47 @@
 # Example file showing a basic pygame "game loop"
 import pygame
 
+from entities.bullet import Bullet
 from entities.cursor import Cursor
+from entities.damage_number import DamageNumber
 from entities.enemy import Enemy
+from entities.explosion import Explosion, debris_system
+from entities.particle_effect import ParticleEffect, ParticleShadow
 from entities.player import Player
 from scenes.scene import Scene
 from systems.camera import Camera
+from systems.enemy_batch import EnemyBatch
 from systems.entity_manager import EntityManager
+from systems.fixed_timestep import FixedTimestep
+from systems.input_source import InputState
+from systems.profiler import profiler
+from systems.render_context import RenderContext, rect_tiles, tiles_to_rects
 from systems.sound_manager import SoundManager
 from systems.wave_manager import WaveManager
 from ui.level_hud import LevelHud
 
+DIRTY_TILE_SIZE = 64  # Dirty rects are merged on a grid of this many pixels
+MAX_DIRTY_COVERAGE = 0.6  # Redraw everything once this share of tiles changed
+DEBRIS_LAYER = 1.5  # Secondary explosions draw over explosions, under enemies
+
 
 class Level(Scene):
-    def __init__(self, screen: pygame.Surface):
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        dirty_rects: bool = False,
+        batch_enemies: bool = False,
+    ):
         self.screen = screen
+        # Update only the parts of the display that changed instead of flipping
+        self.dirty_rects = dirty_rects
+        # Move enemies with vectorized NumPy steering instead of one by one
+        self.batch_enemies = batch_enemies
+        self.previous_tiles: set[tuple[int, int]] = set()  # Drawn last frame
+        self.screen_shifted = True  # Screen does not match the unshifted world
         self.camera = Camera(screen)
         self.game_over_timer = 0  # Delay before showing restart message
+        self.timestep = FixedTimestep()  # Simulation runs at a fixed rate
 
         # load entities
         self.player = Player(screen)
@@ -27,11 +52,61 @@ class Level(Scene):
         self.sound_manager = SoundManager()
         self.entity_manager = EntityManager(sound_manager=self.sound_manager)
         self.entity_manager.camera = self.camera  # Give entity manager access to camera
+        self.entity_manager.arena = screen.get_rect()  # Bullets despawn past its edges
+        if batch_enemies:
+            self.entity_manager.enemy_batch = EnemyBatch(screen.get_size())
+        # Secondary explosions from every explosion share one particle system
+        self.entity_manager.debris = debris_system()
+        # Their shadows go first on the explosions' layer, under the main discs
+        self.debris_shadow = ParticleShadow(screen, self.entity_manager.debris)
+        self.debris = ParticleEffect(
+            screen, self.entity_manager.debris, DEBRIS_LAYER, shadow_color=None
+        )
+        for entity_type in (Bullet, Explosion, DamageNumber):
+            self.entity_manager.register_pool(entity_type)
         self.wave_manager = WaveManager(
             entity_manager=self.entity_manager, screen=screen
         )
         self.cursor = Cursor(screen)
         self.hud = LevelHud()
+        self.allocate_surfaces()
+
+    def allocate_surfaces(self):
+        """Create the world render target and pre-render overlays for the screen size"""
+        size = self.screen.get_size()
+        center_x, center_y = size[0] / 2, size[1] / 2
+
+        # Entities draw to the world surface, which is blitted with the camera offset
+        self.world_surface = pygame.Surface(size)
+        self.world_context = RenderContext(
+            self.world_surface, track_dirty=self.dirty_rects
+        )
+        self.screen_context = RenderContext(self.screen, track_dirty=self.dirty_rects)
+        self.previous_tiles = set()
+        self.screen_bounds = self.screen.get_rect()
+        columns = -(-size[0] // DIRTY_TILE_SIZE)
+        rows = -(-size[1] // DIRTY_TILE_SIZE)
+        self.max_dirty_tiles = int(columns * rows * MAX_DIRTY_COVERAGE)
+
+        # Semi-transparent dark layer behind the pause and game over text
+        self.dim_overlay = pygame.Surface(size)
+        self.dim_overlay.set_alpha(180)
+        self.dim_overlay.fill((0, 0, 0))
+
+        font_large = pygame.font.Font(None, 74)
+        font_small = pygame.font.Font(None, 36)
+        self.game_over_text = render_centered(
+            font_large, "GAME OVER", (255, 50, 50), (center_x, center_y - 50)
+        )
+        self.restart_text = render_centered(
+            font_small, "Press R to Restart", (255, 255, 255), (center_x, center_y + 50)
+        )
+        self.pause_text = render_centered(
+            font_large, "PAUSED", (255, 255, 255), (center_x, center_y - 50)
+        )
+        self.resume_text = render_centered(
+            font_small, "esc to resume", (255, 255, 255), (center_x, center_y + 10)
+        )
 
     def setup(self):
         pygame.mouse.set_visible(False)
@@ -40,6 +115,8 @@ class Level(Scene):
         self.sound_manager.load_sound("explosion", "assets/sounds/Boom10.wav")
         self.sound_manager.load_sound("hit", "assets/sounds/Hit.wav")
 
+        self.entity_manager.instantiate(self.debris_shadow)
+        self.entity_manager.instantiate(self.debris)
         self.entity_manager.instantiate(self.player)
         self.entity_manager.instantiate(self.cursor)
 
@@ -52,13 +129,16 @@ class Level(Scene):
         self.entity_manager.score = 0
 
         # Clear all entities
-        self.entity_manager.entities.clear()
+        self.entity_manager.clear()
+        self.entity_manager.debris.clear()
 
         # Recreate player and cursor
         self.player = Player(self.screen)
         self.cursor = Cursor(self.screen)
 
         # Re-instantiate them
+        self.entity_manager.instantiate(self.debris_shadow)
+        self.entity_manager.instantiate(self.debris)
         self.entity_manager.instantiate(self.player)
         self.entity_manager.instantiate(self.cursor)
 
@@ -68,8 +148,22 @@ class Level(Scene):
         self.wave_manager.enemies_spawned = 0
         self.wave_manager.time_since_last_spawn = 0.0
         self.wave_manager.start_next_wave()
+        self.timestep.reset()
+
+    def handle_profiler_keys(self, input_state: InputState):
+        """F3 toggles the profiler overlay, F4 writes a trace of recent frames"""
+        if input_state.key_just_pressed(pygame.K_F3):
+            profiler.toggle()
+        if input_state.key_just_pressed(pygame.K_F4) and profiler.enabled:
+            profiler.export_chrome_trace("profile_trace.json")
+            print("Wrote profile_trace.json")
+
+    def render(self, dt: float, input_state: InputState):
+        """Run the simulation steps this frame's time covers, then draw once"""
+        self.entity_manager.input = input_state
+        self.handle_profiler_keys(input_state)
+        profiler.begin_frame()
 
-    def render(self, dt: float):
         # Check if player is dead
         if not self.entity_manager.game_over and self.player.hp <= 0:
             self.entity_manager.game_over = True
@@ -78,99 +172,111 @@ class Level(Scene):
         # Handle restart input
         if self.entity_manager.game_over:
             self.game_over_timer += dt
-            keys = pygame.key.get_pressed()
             if (
-                keys[pygame.K_r] and self.game_over_timer > 1.0
+                input_state.key_pressed(pygame.K_r) and self.game_over_timer > 1.0
             ):  # Wait 1 second before allowing restart
                 self.restart()
                 return
 
-        # Update camera shake
-        self.camera.update(dt)
+        for _ in range(self.timestep.advance(dt)):
+            self.update(self.timestep.step)
+        self.draw(dt, self.timestep.alpha)
+
+    def update(self, step: float):
+        """Advance the camera, entities and waves by one fixed step"""
+        self.camera.update(step)
+        self.entity_manager.update(step)
+        self.wave_manager.update(step)
+
+    def draw(self, dt: float, alpha: float):
+        """Draw the world alpha of the way between the last two simulation steps"""
+        # The cursor tracks the mouse every frame, not every simulation step
+        self.cursor.follow_input()
+
+        # Reallocate render targets only when the screen changes size
+        full_redraw = not self.dirty_rects
+        if self.world_surface.get_size() != self.screen.get_size():
+            self.allocate_surfaces()
+            full_redraw = True
 
         # Get camera offset
         offset = self.camera.get_offset()
 
-        # Create a surface for the world (with camera offset)
-        world_surface = pygame.Surface(self.screen.get_size())
-        world_surface.fill("blue")
-
-        # Temporarily replace screen with world surface for entities to draw on
-        original_screen = self.screen
-        for entity in self.entity_manager.entities:
-            entity.screen = world_surface
+        # Camera shake moves the whole world and overlays cover the whole screen,
+        # and both leave the screen to be redrawn in full once they are gone
+        shifted = bool(offset.x or offset.y) or profiler.enabled
+        shifted = shifted or self.entity_manager.paused or self.entity_manager.game_over
+        if shifted or self.screen_shifted:
+            full_redraw = True
+        self.screen_shifted = shifted
 
-        # Update entities (they draw to world_surface)
+        # Draw entities to the world surface, erasing only last frame's drawing
+        # when the rest of the screen is still valid
         # Note: Cursor will be drawn separately later to appear on top of overlays
-        self.entity_manager.update(dt)
-        self.wave_manager.update(dt)
+        if full_redraw or len(self.previous_tiles) > self.max_dirty_tiles:
+            self.world_surface.fill("blue")
+        else:
+            for rect in tiles_to_rects(self.previous_tiles, DIRTY_TILE_SIZE):
+                self.world_surface.fill("blue", rect)
+        self.world_context.alpha = alpha
+        self.entity_manager.draw(self.world_context)
+        world_tiles = rect_tiles(
+            self.world_context.take_dirty_rects(), DIRTY_TILE_SIZE, self.screen_bounds
+        )
 
-        # Restore original screen
-        for entity in self.entity_manager.entities:
-            entity.screen = original_screen
+        # Restore what was drawn last frame and what is drawn now, unless so much
+        # changed that copying the whole world is cheaper
+        changed_tiles = self.previous_tiles | world_tiles
+        if len(changed_tiles) > self.max_dirty_tiles:
+            full_redraw = True
 
         # Draw world surface to screen with camera offset
-        self.screen.blit(world_surface, offset)
+        with profiler.section("world_blit"):
+            if full_redraw:
+                self.screen.blit(self.world_surface, offset)
+            else:
+                changed_rects = tiles_to_rects(changed_tiles, DIRTY_TILE_SIZE)
+                for rect in changed_rects:
+                    self.screen.blit(self.world_surface, rect, rect)
 
         # Draw game over screen
         if self.entity_manager.game_over:
-            # Semi-transparent dark overlay
-            overlay = pygame.Surface(self.screen.get_size())
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
-
-            # Game over text
-            font_large = pygame.font.Font(None, 74)
-            font_small = pygame.font.Font(None, 36)
-
-            game_over_text = font_large.render("GAME OVER", True, (255, 50, 50))
-            game_over_rect = game_over_text.get_rect(
-                center=(self.screen.get_width() / 2, self.screen.get_height() / 2 - 50)
-            )
-            self.screen.blit(game_over_text, game_over_rect)
+            self.screen.blit(self.dim_overlay, (0, 0))
+            self.screen.blit(*self.game_over_text)
 
             # Show restart message after delay
             if self.game_over_timer > 1.0:
-                restart_text = font_small.render(
-                    "Press R to Restart", True, (255, 255, 255)
-                )
-                restart_rect = restart_text.get_rect(
-                    center=(
-                        self.screen.get_width() / 2,
-                        self.screen.get_height() / 2 + 50,
-                    )
-                )
-                self.screen.blit(restart_text, restart_rect)
+                self.screen.blit(*self.restart_text)
 
         # Draw pause screen
         if self.entity_manager.paused:
-            overlay = pygame.Surface(self.screen.get_size())
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.dim_overlay, (0, 0))
+            self.screen.blit(*self.pause_text)
+            self.screen.blit(*self.resume_text)
 
-            font_large = pygame.font.Font(None, 74)
-            font_small = pygame.font.Font(None, 36)
+        # Draw cursor on top of everything (overlays, HUD, etc.)
+        self.cursor.draw_shadow(self.screen_context)
+        self.cursor.draw(self.screen_context)
+        screen_rects = self.screen_context.take_dirty_rects()
 
-            pause_text = font_large.render("PAUSED", True, (255, 255, 255))
-            pause_rect = pause_text.get_rect(
-                center=(self.screen.get_width() / 2, self.screen.get_height() / 2 - 50)
-            )
-            self.screen.blit(pause_text, pause_rect)
-
-            resume_text = font_small.render("esc to resume", True, (255, 255, 255))
-            resume_rect = resume_text.get_rect(
-                center=(
-                    self.screen.get_width() / 2,
-                    self.screen.get_height() / 2 + 10,
-                )
+        screen_rects += self.hud.render(self.screen, dt, self.player, self.wave_manager)
+        profiler.end_frame()
+        profiler.draw_overlay(self.screen)
+
+        # Everything drawn this frame is erased from the world surface next frame
+        screen_tiles = rect_tiles(screen_rects, DIRTY_TILE_SIZE, self.screen_bounds)
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(
+                tiles_to_rects(changed_tiles | screen_tiles, DIRTY_TILE_SIZE)
             )
-            self.screen.blit(resume_text, resume_rect)
+        self.previous_tiles = world_tiles | screen_tiles
 
-        # Draw cursor on top of everything (overlays, HUD, etc.)
-        self.cursor.draw_shadow()
-        self.cursor.draw()
 
-        self.hud.render(self.screen, dt, self.player, self.wave_manager)
-        pygame.display.flip()
+def render_centered(
+    font: pygame.font.Font, text: str, color: tuple, center: tuple
+) -> tuple[pygame.Surface, pygame.Rect]:
+    """Render a line of text once, returning it with the rect that centers it"""
+    surface = font.render(text, True, color)
+    return surface, surface.get_rect(center=center)
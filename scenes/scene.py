@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from systems.input_source import InputState
+
 
 class Scene(ABC):
     @abstractmethod
@@ -7,5 +9,5 @@ class Scene(ABC):
         pass
 
     @abstractmethod
-    def render(self, dt: float):
+    def render(self, dt: float, input_state: InputState):
         pass
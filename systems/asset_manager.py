@@ -0,0 +1,71 @@
+import pygame
+
+
+class AssetManager:
+    """Process-wide image registry so each file is decoded and scaled only once
+
+    Returned surfaces are shared between every entity using them and must not be
+    drawn on or filled in place; copy them first.
+    """
+
+    def __init__(self, scale_steps: int = 16):
+        self.images: dict[str, pygame.Surface] = {}
+        self.scaled_images: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+        self.scale_chains: dict[tuple[str, int], list] = {}
+        self.scale_steps = scale_steps  # Discrete sizes used by grow/shrink animations
+
+    def load_image(self, path: str) -> pygame.Surface:
+        """Decode an image file on first use and return the cached surface after"""
+        image = self.images.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert_alpha()
+            self.images[path] = image
+        return image
+
+    def get_scaled(self, path: str, size: tuple[int, int]) -> pygame.Surface:
+        """Return the image at path scaled to size, memoized by (path, size)"""
+        key = (path, size)
+        scaled = self.scaled_images.get(key)
+        if scaled is None:
+            scaled = pygame.transform.scale(self.load_image(path), size)
+            self.scaled_images[key] = scaled
+        return scaled
+
+    def get_scale_chain(self, path: str, size: int) -> list:
+        """Every discrete scale step of a square sprite, built once per (path, size)
+
+        Index i holds the image scaled to i / scale_steps of size; index 0 is None
+        since a sprite scaled to nothing is not drawn.
+        """
+        key = (path, size)
+        chain = self.scale_chains.get(key)
+        if chain is None:
+            chain = [None]
+            for step in range(1, self.scale_steps + 1):
+                step_size = max(1, size * step // self.scale_steps)
+                chain.append(self.get_scaled(path, (step_size, step_size)))
+            self.scale_chains[key] = chain
+        return chain
+
+    def get_scale_step(
+        self, path: str, size: int, scale_x: float, scale_y: float = None
+    ) -> pygame.Surface | None:
+        """Sprite snapped to the nearest discrete scale step instead of rescaled"""
+        steps = self.scale_steps
+        step_x = min(steps, max(0, round(scale_x * steps)))
+        if scale_y is None or scale_y == scale_x:
+            return self.get_scale_chain(path, size)[step_x]
+
+        # Non-uniform scaling snaps each axis and is memoized like any other size
+        step_y = min(steps, max(0, round(scale_y * steps)))
+        if step_x == 0 or step_y == 0:
+            return None
+        return self.get_scaled(path, (size * step_x // steps, size * step_y // steps))
+
+    def clear(self):
+        self.images.clear()
+        self.scaled_images.clear()
+        self.scale_chains.clear()
+
+
+asset_manager = AssetManager()
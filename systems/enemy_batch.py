@@ -0,0 +1,312 @@
+import random
+
+import numpy as np
+import pygame
+
+CHASE, WANDER, DASH = range(3)
+STEERING_KINDS = {"chase": CHASE, "wander": WANDER, "dash": DASH}
+
+DASH_LINE_LENGTH = 2000  # Length of the Dasher telegraph line
+STOP_SPEED = 5  # Friction stops an enemy moving slower than this
+
+
+class EnemyBatch:
+    """Moves every batched enemy in one set of NumPy array operations per step
+
+    Each enemy whose class names a steering kind ("chase", "wander" or "dash") owns
+    one row of arrays holding its position, velocity, acceleration, max speed,
+    friction, growth and steering state. step() runs the growth animation, steering,
+    friction, speed clamp, integration and screen clamp for all rows at once, then
+    writes the results back to the enemy objects, which stay the public view used by
+    collisions and drawing. Rows are swap-removed, so enemies keep their batch_index
+    up to date. Knockback and other velocity changes made to an enemy between steps
+    are read back in before each step.
+    """
+
+    def __init__(self, screen_size: tuple[int, int], capacity: int = 256):
+        self.screen_size = screen_size
+        self.enemies: list = []  # Row -> enemy
+        self.allocate(capacity)
+
+    def allocate(self, capacity: int):
+        """(Re)allocate the arrays, keeping the rows in use"""
+        count = len(self.enemies)
+        arrays = {
+            "pos": np.zeros((capacity, 2)),
+            "velocity": np.zeros((capacity, 2)),
+            "look": np.zeros((capacity, 2)),
+            "heading": np.zeros((capacity, 2)),  # Wander or dash direction
+            "acceleration": np.zeros(capacity),
+            "max_speed": np.zeros(capacity),
+            "friction": np.zeros(capacity),
+            "radius": np.zeros(capacity),
+            "max_size": np.zeros(capacity),
+            "grow_timer": np.zeros(capacity),
+            "grow_duration": np.ones(capacity),
+            "timer": np.zeros(capacity),  # Wander or telegraph timer
+            "interval": np.ones(capacity),  # Wander interval or telegraph duration
+            "kind": np.zeros(capacity, dtype=np.int8),
+            "growing": np.zeros(capacity, dtype=bool),
+            "dashed": np.zeros(capacity, dtype=bool),
+        }
+        for name, array in arrays.items():
+            if count:
+                array[:count] = getattr(self, name)[:count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self.enemies)
+
+    @staticmethod
+    def steering_kind(enemy) -> int | None:
+        return STEERING_KINDS.get(getattr(enemy, "steering", None))
+
+    def insert(self, enemy) -> bool:
+        """Give an enemy a row, returning False if its steering is not batched"""
+        kind = self.steering_kind(enemy)
+        if kind is None:
+            return False
+        row = len(self.enemies)
+        if row == self.capacity:
+            self.allocate(self.capacity * 2)
+        self.enemies.append(enemy)
+        enemy.batch_index = row
+
+        self.pos[row] = enemy.pos
+        self.velocity[row] = enemy.velocity
+        self.look[row] = enemy.look_direction
+        self.acceleration[row] = enemy.acceleration
+        self.max_speed[row] = enemy.max_speed
+        self.friction[row] = enemy.friction
+        self.radius[row] = enemy.collision_radius
+        self.max_size[row] = enemy.max_size
+        self.grow_timer[row] = enemy.grow_timer
+        self.grow_duration[row] = enemy.grow_duration
+        self.growing[row] = enemy.is_growing
+        self.kind[row] = kind
+        if kind == WANDER:
+            self.heading[row] = enemy.wander_direction
+            self.timer[row] = enemy.wander_timer
+            self.interval[row] = enemy.wander_interval
+            self.dashed[row] = False
+        elif kind == DASH:
+            self.heading[row] = enemy.dash_direction or (0, 0)
+            self.timer[row] = enemy.telegraph_timer
+            self.interval[row] = enemy.telegraph_duration
+            self.dashed[row] = enemy.has_dashed
+        else:
+            self.heading[row] = (0, 0)
+            self.timer[row] = 0
+            self.dashed[row] = False
+        return True
+
+    def remove(self, enemy):
+        """Free an enemy's row by moving the last row into it"""
+        row = getattr(enemy, "batch_index", None)
+        if row is None:
+            return
+        enemy.batch_index = None
+        last = len(self.enemies) - 1
+        moved = self.enemies.pop()
+        if row != last:
+            self.enemies[row] = moved
+            moved.batch_index = row
+            for name in (
+                "pos",
+                "velocity",
+                "look",
+                "heading",
+                "acceleration",
+                "max_speed",
+                "friction",
+                "radius",
+                "max_size",
+                "grow_timer",
+                "grow_duration",
+                "timer",
+                "interval",
+                "kind",
+                "growing",
+                "dashed",
+            ):
+                array = getattr(self, name)
+                array[row] = array[last]
+
+    def clear(self):
+        for enemy in self.enemies:
+            enemy.batch_index = None
+        self.enemies.clear()
+
+    def hold(self):
+        """Keep batched enemies still for a step that does not move them, so they
+        are not drawn between a stale previous position and the current one"""
+        for enemy in self.enemies:
+            enemy.prev_pos.update(enemy.pos)
+
+    def step(self, dt: float, player=None):
+        """Advance every batched enemy by one simulation step"""
+        count = len(self.enemies)
+        if not count:
+            return
+        enemies = self.enemies
+
+        # Read back positions and velocities, which collisions and knockback change
+        state = []
+        for enemy in enemies:
+            enemy.prev_pos.update(enemy.pos)
+            state.append((enemy.pos.x, enemy.pos.y, enemy.velocity.x, enemy.velocity.y))
+        state = np.array(state)
+        pos = self.pos[:count]
+        velocity = self.velocity[:count]
+        pos[:] = state[:, :2]
+        velocity[:] = state[:, 2:]
+
+        # Growth animation
+        growing = self.growing[:count]
+        was_growing = growing.copy()
+        self.grow_timer[:count][growing] += dt
+        growing &= self.grow_timer[:count] < self.grow_duration[:count]
+        grown = ~growing
+
+        half_size = self.max_size[:count] / 2
+        width, height = self.screen_size
+        kind = self.kind[:count]
+        heading = self.heading[:count]
+        timer = self.timer[:count]
+        interval = self.interval[:count]
+        dashed = self.dashed[:count]
+        direction = np.zeros((count, 2))  # Unit acceleration direction, or zero
+        telegraph_lines = {}  # Row -> telegraph line start and end
+
+        if player is not None:
+            to_player = np.array((player.pos.x, player.pos.y)) - pos
+            distance = np.hypot(to_player[:, 0], to_player[:, 1])
+            unit_to_player = np.divide(
+                to_player,
+                distance[:, None],
+                out=np.zeros_like(to_player),
+                where=distance[:, None] > 0,
+            )
+
+            # Chase the player unless already touching it
+            chase = (kind == CHASE) & grown & (distance > self.radius[:count])
+            direction[chase] = unit_to_player[chase]
+
+        # Wander in a direction that changes every few seconds and bounces off walls
+        wander = (kind == WANDER) & grown
+        if wander.any():
+            timer[wander] += dt
+            for row in np.flatnonzero(wander & (timer >= interval)).tolist():
+                heading[row] = pygame.Vector2(1, 0).rotate(random.uniform(0, 360))
+                interval[row] = random.uniform(1.0, 3.0)
+                timer[row] = 0
+            for axis, limit in ((0, width), (1, height)):
+                bounce = wander & (
+                    (pos[:, axis] <= half_size) | (pos[:, axis] >= limit - half_size)
+                )
+                heading[bounce, axis] *= -1
+                velocity[bounce, axis] *= -0.5
+            direction[wander] = heading[wander]
+
+        # Telegraph toward the player, dash once, then telegraph again at a wall
+        dash = (kind == DASH) & grown
+        if player is not None and dash.any():
+            telegraph = dash & ~dashed
+            timer[telegraph] += dt
+            line_ends = pos + unit_to_player * DASH_LINE_LENGTH
+            for row in np.flatnonzero(telegraph).tolist():
+                telegraph_lines[row] = (tuple(pos[row]), tuple(line_ends[row]))
+            launch = telegraph & (timer >= interval)
+            dashed[launch] = True
+            heading[launch] = unit_to_player[launch]
+            velocity[launch] = heading[launch] * self.max_speed[:count, None][launch]
+
+            dashing = dash & dashed & ~launch
+            margin = half_size + 5
+            at_wall = dashing & (
+                (pos[:, 0] <= margin)
+                | (pos[:, 0] >= width - margin)
+                | (pos[:, 1] <= margin)
+                | (pos[:, 1] >= height - margin)
+            )
+            dashed[at_wall] = False
+            timer[at_wall] = 0
+            heading[at_wall] = 0
+            dashing &= ~at_wall
+            direction[dashing] = heading[dashing]
+
+        # Accelerate, or slow down with friction when there is nothing to steer to
+        accelerating = direction.any(axis=1)
+        velocity += direction * (self.acceleration[:count] * dt)[:, None]
+        coasting = ~accelerating
+        speed = np.hypot(velocity[:, 0], velocity[:, 1])
+        damping = np.maximum(0, 1 - self.friction[:count] * dt)
+        velocity[coasting] *= damping[coasting, None]
+        speed[coasting] *= damping[coasting]
+        stopped = coasting & (speed < STOP_SPEED)
+        velocity[stopped] = 0
+        speed[stopped] = 0
+
+        # Clamp to max speed and face the direction of travel
+        max_speed = self.max_speed[:count]
+        too_fast = speed > max_speed
+        velocity[too_fast] *= (max_speed[too_fast] / speed[too_fast])[:, None]
+        speed[too_fast] = max_speed[too_fast]
+        moving = speed > 0
+        look = self.look[:count]
+        look[moving] = velocity[moving] / speed[moving, None]
+
+        # Integrate, keeping fully grown enemies on screen
+        pos += velocity * dt
+        pos[grown, 0] = np.clip(
+            pos[grown, 0], half_size[grown], width - half_size[grown]
+        )
+        pos[grown, 1] = np.clip(
+            pos[grown, 1], half_size[grown], height - half_size[grown]
+        )
+
+        self.write_back(was_growing, telegraph_lines)
+
+    def write_back(self, was_growing: np.ndarray, telegraph_lines: dict):
+        """Copy the stepped rows onto the enemy objects and rebucket them, so actors
+        updated before them this step query their new cells"""
+        count = len(self.enemies)
+        enemies = self.enemies
+        rows = np.concatenate(
+            (self.pos[:count], self.velocity[:count], self.look[:count]), axis=1
+        )
+        for enemy, (x, y, vx, vy, look_x, look_y) in zip(enemies, rows.tolist()):
+            enemy.pos.update(x, y)
+            enemy.velocity.update(vx, vy)
+            enemy.look_direction.update(look_x, look_y)
+            if enemy.entity_manager:
+                enemy.entity_manager.spatial_hash.update(enemy)
+
+        for row in np.flatnonzero(was_growing).tolist():
+            enemy = enemies[row]
+            enemy.grow_timer = float(self.grow_timer[row])
+            enemy.is_growing = bool(self.growing[row])
+            enemy.current_size = enemy.max_size * min(
+                1.0, enemy.grow_timer / enemy.grow_duration
+            )
+
+        kind = self.kind[:count]
+        for row in np.flatnonzero(kind == WANDER).tolist():
+            enemy = enemies[row]
+            enemy.wander_direction.update(self.heading[row].tolist())
+            enemy.wander_timer = float(self.timer[row])
+            enemy.wander_interval = float(self.interval[row])
+
+        for row in np.flatnonzero(kind == DASH).tolist():
+            enemy = enemies[row]
+            dashed = bool(self.dashed[row])
+            enemy.has_dashed = dashed
+            enemy.dash_direction = (
+                pygame.Vector2(self.heading[row].tolist()) if dashed else None
+            )
+            enemy.telegraph_timer = float(self.timer[row])
+            line = telegraph_lines.get(row)
+            if line:
+                enemy.line_start = pygame.Vector2(line[0])
+                enemy.line_end = pygame.Vector2(line[1])
@@ -1,45 +1,313 @@
+import bisect
+
+from entities.actor import Actor
 from entities.entity import Entity
+from entities.player import Player
 import pygame
 
+from systems.enemy_batch import EnemyBatch
+from systems.input_source import NO_INPUT
+from systems.object_pool import ObjectPool
+from systems.particle_system import ParticleSystem
+from systems.render_context import RenderContext
+from systems.spatial_hash import SpatialHash
+from tags.tags import SINGLE_TAGS, Tag, TagSet
+
 
 class EntityManager:
     def __init__(self, sound_manager=None):
-        self.entities: list[Entity] = []
+        self.layers: dict[int, list[Entity]] = {}  # Layer -> entities in spawn order
+        self.layer_order: list[int] = []  # Layer keys, kept sorted for drawing
+        self._entities: list[Entity] | None = []  # Flattened view, None when stale
         self.sound_manager = sound_manager
+        self.input = NO_INPUT  # This frame's input snapshot, read by entities
         self.score = 0
         self.paused = False
         self.pause_key_timer = 0  # Timer for pause key debounce
         self.game_over = False
+        self.spatial_hash = SpatialHash()  # Broadphase for actor collisions
+        self.destroy_queue: list[Entity] = []  # Removed from their layer on flush
+        self.pools: dict[type, ObjectPool] = {}  # Entity type -> recycled instances
+        self.next_entity_id = 1  # IDs are never reused, pooled entities get a new one
+        self.debris: ParticleSystem | None = None  # Shared explosion debris particles
+        self.enemy_batch: EnemyBatch | None = None  # Moves enemies as arrays when set
+        self.arena: pygame.Rect | None = None  # Entities with a margin despawn outside
+
+        # Live entities by tag and by class (including base classes), as
+        # insertion-ordered dicts used as sets
+        self.tag_index: dict[Tag, dict[Entity, None]] = {tag: {} for tag in SINGLE_TAGS}
+        self.type_index: dict[type, dict[Entity, None]] = {}
+
+    @property
+    def entities(self) -> list[Entity]:
+        """Every entity in layer order, rebuilt only after the set of entities changes"""
+        if self._entities is None:
+            entities = []
+            for layer in self.layer_order:
+                entities.extend(self.layers[layer])
+            self._entities = entities
+        return self._entities
 
     def instantiate(self, entity: Entity, lifetime: float = -1):
         entity.entity_manager = self
+        entity.alive = True
+        entity.entity_id = self.next_entity_id
+        self.next_entity_id += 1
         if lifetime != -1:
             entity.lifetime = lifetime
-        self.entities.append(entity)
-        # Sort immediately after adding to maintain layer order
-        self.entities.sort(key=lambda e: getattr(e, "layer", 0))
+        # Start without a previous state to interpolate from
+        entity.prev_pos.update(entity.pos)
+        entity.render_pos.update(entity.pos)
+
+        # Append to the entity's layer bucket, keeping draw order without sorting
+        layer = getattr(entity, "layer", 0)
+        bucket = self.layers.get(layer)
+        if bucket is None:
+            bucket = self.layers[layer] = []
+            bisect.insort(self.layer_order, layer)
+        bucket.append(entity)
+        self._entities = None
+
+        if isinstance(entity, Actor):
+            self.spatial_hash.insert(entity)
+        if self.enemy_batch is not None:
+            self.enemy_batch.insert(entity)
+        self._index(entity)
+
+    def register_pool(self, entity_type: type, **kwargs) -> ObjectPool:
+        """Recycle destroyed entities of this type through spawn()"""
+        pool = self.pools[entity_type] = ObjectPool(entity_type, **kwargs)
+        return pool
+
+    def spawn(self, entity_type: type, *args, **kwargs) -> Entity:
+        """Create and instantiate an entity, reusing a pooled instance if possible"""
+        pool = self.pools.get(entity_type)
+        if pool:
+            entity = pool.acquire(*args, **kwargs)
+        else:
+            entity = entity_type(*args, **kwargs)
+        self.instantiate(entity)
+        return entity
+
+    def pool_stats(self) -> dict:
+        return {
+            entity_type.__name__: pool.stats()
+            for entity_type, pool in self.pools.items()
+        }
 
     def destroy(self, entity: Entity):
-        if entity in self.entities:
-            self.entities.remove(entity)
+        """Take an entity out of play now and queue its removal for the next flush
+
+        Safe to call while entities are being updated, and more than once.
+        """
+        if not entity.alive or entity.entity_manager is not self:
+            return
+        entity.alive = False
+        self.destroy_queue.append(entity)
+        self.spatial_hash.remove(entity)
+        if self.enemy_batch is not None:
+            self.enemy_batch.remove(entity)
+        self._unindex(entity)
+
+    def _index(self, entity: Entity):
+        for tag in entity.tags:
+            self.tag_index[tag][entity] = None
+        for entity_type in type(entity).__mro__:
+            if entity_type is Entity:
+                break
+            self.type_index.setdefault(entity_type, {})[entity] = None
+
+    def _unindex(self, entity: Entity):
+        for tag in entity.tags:
+            self.tag_index[tag].pop(entity, None)
+        for entity_type in type(entity).__mro__:
+            if entity_type is Entity:
+                break
+            self.type_index[entity_type].pop(entity, None)
+
+    def get_player(self) -> Player | None:
+        """The live player, if any"""
+        players = self.type_index.get(Player)
+        if players:
+            return next(iter(players))
+        return None
+
+    def count(self, key: Tag | type) -> int:
+        """Live entities with any of the given tags, or of a class and its subclasses"""
+        if isinstance(key, Tag):
+            return len(self._tagged(key))
+        return len(self.type_index.get(key, ()))
+
+    def with_tags(self, tags: Tag) -> list[Entity]:
+        """Live entities carrying any of the given tags, in spawn order per tag"""
+        return list(self._tagged(tags))
+
+    def _tagged(self, tags: Tag) -> dict[Entity, None]:
+        """Indexed entities for a single tag, or the deduplicated union for a mask"""
+        if tags in self.tag_index:
+            return self.tag_index[tags]
+        found = {}
+        for tag in SINGLE_TAGS:
+            if tags & tag:
+                found.update(self.tag_index[tag])
+        return found
+
+    def of_type(self, entity_type: type) -> list[Entity]:
+        """Live entities of a class or any of its subclasses"""
+        return list(self.type_index.get(entity_type, ()))
+
+    def flush_destroyed(self):
+        """Remove queued entities from their layers, one compaction pass per layer"""
+        if not self.destroy_queue:
+            return
+
+        dirty_layers = {getattr(entity, "layer", 0) for entity in self.destroy_queue}
+        for layer in dirty_layers:
+            bucket = self.layers.get(layer)
+            if bucket is not None:
+                bucket[:] = [entity for entity in bucket if entity.alive]
+        self._entities = None
+
+        # Only hand entities back to their pool once nothing can reach them
+        for entity in self.destroy_queue:
+            self._release(entity)
+        self.destroy_queue.clear()
+
+    def _release(self, entity: Entity):
+        pool = self.pools.get(type(entity))
+        if pool:
+            pool.release(entity)
+
+    def clear(self):
+        """Remove every entity at once"""
+        for entity in self.entities:
+            if entity.alive:
+                entity.alive = False
+                self._release(entity)
+        for entity in self.destroy_queue:
+            self._release(entity)
+        self.layers.clear()
+        self.layer_order.clear()
+        self._entities = []
+        self.destroy_queue.clear()
+        self.spatial_hash.clear()
+        if self.enemy_batch is not None:
+            self.enemy_batch.clear()
+        for tagged in self.tag_index.values():
+            tagged.clear()
+        self.type_index.clear()
+
+    def get_collision_candidates(self, actor: Actor) -> list:
+        """Actors in the grid cells around the given actor that it could be touching"""
+        return self.spatial_hash.query(actor.pos, actor.collision_radius)
+
+    def query_radius(
+        self,
+        pos: pygame.Vector2,
+        radius: float,
+        tags: Tag = Tag.NONE,
+        ignore_tags: TagSet = None,
+        exclude_ids=(),
+        include_collision_radius: bool = False,
+    ) -> list[Actor]:
+        """Live actors closer than radius to pos, for area damage
+
+        Only actors carrying one of tags are returned when tags is given, and none
+        sharing a tag with ignore_tags. Actors whose entity_id is in exclude_ids, such
+        as those an effect already hit, are skipped. With include_collision_radius an
+        actor counts as soon as its collision circle reaches into the area.
+        """
+        mask = int(tags)
+        ignore = ignore_tags.mask if ignore_tags else 0
+        x, y = pos.x, pos.y
+        found = []
+        for actor in self.spatial_hash.query(pos, radius):
+            actor_tags = actor.tags.mask
+            if mask and not actor_tags & mask:
+                continue
+            if actor_tags & ignore or actor.entity_id in exclude_ids or not actor.alive:
+                continue
+            reach = (
+                radius + actor.collision_radius if include_collision_radius else radius
+            )
+            dx = actor.pos.x - x
+            dy = actor.pos.y - y
+            if dx * dx + dy * dy < reach * reach:
+                found.append(actor)
+        return found
 
     def update(self, dt: float):
+        """Advance the simulation by one step of dt seconds"""
         # Update pause key debounce timer
         if self.pause_key_timer > 0:
             self.pause_key_timer -= dt
 
         # Handle pause toggle with proper debounce
-        if pygame.key.get_pressed()[pygame.K_ESCAPE] and self.pause_key_timer <= 0:
+        if self.input.key_pressed(pygame.K_ESCAPE) and self.pause_key_timer <= 0:
             self.paused = not self.paused
             self.pause_key_timer = 0.2  # 200ms debounce
 
-        # Sort entities by layer before updating
-        self.entities.sort(key=lambda e: getattr(e, "layer", 0))
+        # Move all batched enemies at once, their own updates then only collide
+        if self.enemy_batch is not None:
+            if self.paused:
+                self.enemy_batch.hold()
+            else:
+                self.enemy_batch.step(dt, self.get_player())
 
+        # Walk a snapshot of the layer-ordered entities so each one that is alive at
+        # the start of the tick is updated exactly once. Entities spawned during the
+        # tick start updating next tick, destroyed ones are skipped and removed below.
         for entity in self.entities:
+            if not entity.alive:
+                continue
             if not self.paused and entity.lifetime != -1:
                 entity.lifetime -= dt
                 if entity.lifetime <= 0:
                     self.destroy(entity)
                     continue
+            entity.save_previous_state()
             entity.update(dt)
+            margin = entity.out_of_bounds_margin
+            if margin is not None and self.is_out_of_bounds(entity.pos, margin):
+                self.destroy(entity)
+
+        self.flush_destroyed()
+
+    def is_out_of_bounds(self, pos: pygame.Vector2, margin: float) -> bool:
+        """True when pos is more than margin outside the arena"""
+        arena = self.arena
+        if arena is None:
+            return False
+        x, y = pos.x, pos.y
+        return (
+            x < arena.left - margin
+            or x > arena.right + margin
+            or y < arena.top - margin
+            or y > arena.bottom + margin
+        )
+
+    def draw(self, ctx: RenderContext):
+        """Draw every entity in layer order, each shadow just below its entity
+
+        Entities are drawn ctx.alpha of the way between their previous and current
+        simulated positions. Those with a cull_radius are skipped when that circle
+        lies entirely off the target.
+        """
+        alpha = ctx.alpha
+        width, height = ctx.surface.get_size()
+        for entity in self.entities:
+            entity.interpolate(alpha)
+            if getattr(entity, "skip_auto_draw", False):
+                continue
+            radius = entity.cull_radius
+            if radius is not None:
+                x, y = entity.render_pos.x, entity.render_pos.y
+                if (
+                    x < -radius
+                    or y < -radius
+                    or x > width + radius
+                    or y > height + radius
+                ):
+                    continue
+            entity.draw_shadow(ctx)
+            entity.draw(ctx)
@@ -0,0 +1,35 @@
+SIMULATION_STEP = 1 / 120  # Seconds of game time per simulation step
+
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation steps
+
+    Frame time is banked in an accumulator and spent one step at a time. At most
+    max_steps are run per frame, so a long stall slows the game down instead of
+    spiralling into ever longer catch-up frames. alpha is how far the leftover
+    time reaches into the next step, for interpolating between sim states.
+    """
+
+    def __init__(self, step: float = SIMULATION_STEP, max_steps: int = 5):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, dt: float) -> int:
+        """Bank a frame's time and return how many steps to simulate"""
+        self.accumulator += dt
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # Drop the time we cannot catch up on, keeping the partial step
+            steps = self.max_steps
+            self.accumulator %= self.step
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        return self.accumulator / self.step
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -0,0 +1,111 @@
+from typing import NamedTuple, Sequence
+
+import pygame
+
+
+class HeldKeys(frozenset):
+    """Set of held key codes that can be indexed like pygame.key.get_pressed()"""
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self
+
+
+NO_KEYS = HeldKeys()
+
+
+class InputState(NamedTuple):
+    """Immutable snapshot of the keyboard and mouse, sampled once per frame"""
+
+    keys: Sequence[bool] = NO_KEYS  # Indexed by pygame key constant
+    previous_keys: Sequence[bool] = NO_KEYS  # keys as of the previous frame
+    mouse_position: tuple[int, int] = (0, 0)
+    mouse_buttons: tuple[bool, bool, bool] = (False, False, False)
+
+    def key_pressed(self, key: int) -> bool:
+        return bool(self.keys[key])
+
+    def key_just_pressed(self, key: int) -> bool:
+        """True only on the frame the key went down"""
+        return bool(self.keys[key]) and not self.previous_keys[key]
+
+    def mouse_pos(self) -> tuple[int, int]:
+        return self.mouse_position
+
+    def mouse_pressed(self, button: int = 0) -> bool:
+        return self.mouse_buttons[button]
+
+
+NO_INPUT = InputState()
+
+
+class PygameInput:
+    """Samples the keyboard and mouse from pygame once per frame
+
+    By default devices are polled when sampling. With from_events, state is
+    instead built from the events passed to handle_event, so the main loop's
+    event queue is the only source of input.
+    """
+
+    def __init__(self, from_events: bool = False):
+        self.from_events = from_events
+        self.previous_keys = NO_KEYS
+        self.held_keys: set[int] = set()
+        self.mouse_position = (0, 0)
+        self.mouse_buttons = [False, False, False]
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN:
+            self.held_keys.add(event.key)
+        elif event.type == pygame.KEYUP:
+            self.held_keys.discard(event.key)
+        elif event.type == pygame.MOUSEMOTION:
+            self.mouse_position = event.pos
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            if 1 <= event.button <= 3:
+                pressed = event.type == pygame.MOUSEBUTTONDOWN
+                self.mouse_buttons[event.button - 1] = pressed
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # Releases that happen while unfocused never arrive
+            self.held_keys.clear()
+            self.mouse_buttons = [False, False, False]
+
+    def sample(self) -> InputState:
+        if self.from_events:
+            keys = HeldKeys(self.held_keys)
+            mouse_position = self.mouse_position
+            mouse_buttons = tuple(self.mouse_buttons)
+        else:
+            keys = pygame.key.get_pressed()
+            mouse_position = pygame.mouse.get_pos()
+            mouse_buttons = pygame.mouse.get_pressed()
+        state = InputState(keys, self.previous_keys, mouse_position, mouse_buttons)
+        self.previous_keys = keys
+        return state
+
+
+class ScriptedInput:
+    """Replays input from a script so the game can run without a human
+
+    The script is called with the frame number each time input is sampled and
+    returns a dict with any of "keys" (set of pygame key constants held),
+    "mouse_pos" ((x, y) tuple) and "mouse_buttons" ((left, middle, right) tuple).
+    Missing entries mean nothing held and the mouse at the origin.
+    """
+
+    def __init__(self, script=None):
+        self.script = script
+        self.frame = -1
+        self.previous_keys = NO_KEYS
+
+    def sample(self) -> InputState:
+        self.frame += 1
+        script_state = self.script(self.frame) if self.script else {}
+        keys = HeldKeys(script_state.get("keys", ()))
+        state = InputState(
+            keys,
+            self.previous_keys,
+            tuple(script_state.get("mouse_pos", (0, 0))),
+            tuple(script_state.get("mouse_buttons", (False, False, False))),
+        )
+        self.previous_keys = keys
+        return state
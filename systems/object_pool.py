@@ -0,0 +1,50 @@
+class ObjectPool:
+    """Recycles destroyed entities of one type instead of constructing new ones
+
+    Pooled types implement reset() taking the same arguments as their constructor
+    and restoring every piece of per-life state.
+    """
+
+    def __init__(self, entity_type: type, min_capacity: int = 16, headroom=1.25):
+        self.entity_type = entity_type
+        self.free: list = []
+        self.min_capacity = min_capacity
+        self.headroom = headroom  # Spare room kept above the observed peak
+        self.live = 0
+        self.peak_live = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def capacity(self) -> int:
+        """Free instances kept for reuse, sized from the peak number live at once"""
+        return max(self.min_capacity, int(self.peak_live * self.headroom))
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            entity = self.entity_type(*args, **kwargs)
+            self.misses += 1
+
+        self.live += 1
+        if self.live > self.peak_live:
+            self.peak_live = self.live
+        return entity
+
+    def release(self, entity):
+        self.live -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(entity)
+
+    def stats(self) -> dict:
+        return {
+            "live": self.live,
+            "free": len(self.free),
+            "capacity": self.capacity,
+            "peak_live": self.peak_live,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
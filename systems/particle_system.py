@@ -0,0 +1,126 @@
+import numpy as np
+import pygame
+
+from systems.render_context import RenderContext
+
+
+def trail_size_curve(t: np.ndarray) -> np.ndarray:
+    """Player trail: growing over the first tenth of its life, then shrinking from double size"""
+    return np.where(t < 0.1, t * 2, (1 - t) * 2)
+
+
+def grow_shrink_curve(grow_fraction: float):
+    """Size curve growing linearly to full size, then shrinking linearly to zero"""
+
+    def curve(t: np.ndarray) -> np.ndarray:
+        return np.where(
+            t < grow_fraction, t / grow_fraction, (1 - t) / (1 - grow_fraction)
+        )
+
+    return curve
+
+
+class ParticleSystem:
+    """Fixed-capacity particles stored as NumPy arrays
+
+    Each particle appears delay seconds after it is emitted and lives for duration
+    seconds after that. Its diameter is max_size scaled by size_curve(t), where t
+    runs from 0 to 1 over its visible life. update() advances every particle in a
+    few array operations and compacts the survivors to the front, keeping them in
+    emission order. Particles emitted while the system is full are dropped.
+    """
+
+    def __init__(self, capacity: int = 1024, size_curve=trail_size_curve):
+        self.capacity = capacity
+        self.size_curve = size_curve
+        self.count = 0
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.delay = np.zeros(capacity, dtype=np.float32)
+        self.duration = np.ones(capacity, dtype=np.float32)
+        self.max_size = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.arrays = (
+            self.pos,
+            self.velocity,
+            self.age,
+            self.delay,
+            self.duration,
+            self.max_size,
+            self.color,
+        )
+
+    def emit(
+        self,
+        pos: pygame.Vector2,
+        max_size: float,
+        duration: float,
+        color: tuple,
+        delay: float = 0.0,
+        velocity: pygame.Vector2 = None,
+    ) -> bool:
+        """Add a particle, returning False if the system is full"""
+        index = self.count
+        if index >= self.capacity:
+            return False
+        self.pos[index] = (pos[0], pos[1])
+        self.velocity[index] = (velocity[0], velocity[1]) if velocity else (0, 0)
+        self.age[index] = 0.0
+        self.delay[index] = delay
+        self.duration[index] = duration
+        self.max_size[index] = max_size
+        self.size[index] = 0.0
+        self.color[index] = color[:3]
+        self.count += 1
+        return True
+
+    def update(self, dt: float):
+        count = self.count
+        if not count:
+            return
+
+        age = self.age[:count]
+        age += dt
+        alive = age < self.delay[:count] + self.duration[:count]
+        if not alive.all():
+            # Move the survivors to the front in one pass per array
+            count = int(alive.sum())
+            for array in self.arrays:
+                array[:count] = array[: self.count][alive]
+            self.count = count
+            if not count:
+                return
+
+        self.pos[:count] += self.velocity[:count] * dt
+        t = (self.age[:count] - self.delay[:count]) / self.duration[:count]
+        visible = t > 0
+        self.size[:count] = np.where(
+            visible, self.max_size[:count] * self.size_curve(np.clip(t, 0, 1)), 0
+        )
+
+    def draw(self, ctx: RenderContext, color=None, offset_y: float = 0.0):
+        """Draw every visible particle as a circle, optionally all in one color"""
+        count = self.count
+        if not count:
+            return
+        radii = (self.size[:count] / 2).tolist()
+        positions = self.pos[:count].tolist()
+        colors = self.color[:count].tolist() if color is None else None
+        surface = ctx.surface
+        for index, radius in enumerate(radii):
+            if radius <= 0:
+                continue
+            x, y = positions[index]
+            ctx.mark(
+                pygame.draw.circle(
+                    surface,
+                    colors[index] if color is None else color,
+                    (x, y + offset_y),
+                    radius,
+                )
+            )
+
+    def clear(self):
+        self.count = 0
@@ -0,0 +1,266 @@
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame
+
+from entities.actor import Actor
+from entities.entity import Entity
+from systems.sprite_cache import sprite_cache
+from systems.wave_manager import WaveManager
+from ui.level_hud import LevelHud
+
+ENTITY_METHODS = ("update", "draw", "draw_shadow")
+
+# (owner, method name, label) for the game stages timed besides entity methods
+STAGE_HOOKS = (
+    (Actor, "resolve_collisions", "collision"),
+    (Actor, "resolve_swept_collisions", "collision"),
+    (sprite_cache, "get_filled", "sprite_cache.get_filled"),
+    (WaveManager, "update", "WaveManager.update"),
+    (LevelHud, "render", "LevelHud.render"),
+)
+
+_disabled_section = nullcontext()
+
+
+def all_subclasses(cls: type) -> list[type]:
+    found = {}
+    for subclass in cls.__subclasses__():
+        found[subclass] = None
+        found.update(dict.fromkeys(all_subclasses(subclass)))
+    return list(found)
+
+
+class _Section:
+    __slots__ = ("profiler", "label")
+
+    def __init__(self, profiler: "Profiler", label: str):
+        self.profiler = profiler
+        self.label = label
+
+    def __enter__(self):
+        self.profiler.push(self.label)
+
+    def __exit__(self, *exc_info):
+        self.profiler.pop()
+
+
+class Profiler:
+    """Per-frame timings of game stages and of each entity class's methods
+
+    While enabled, the timed methods are wrapped in place and every call is
+    recorded. Frames keep self time per label (time not spent in nested timed
+    calls) and the individual calls for trace export. The last max_frames frames
+    are kept in a ring buffer. While disabled no wrappers are installed.
+    """
+
+    def __init__(self, max_frames: int = 300):
+        self.enabled = False
+        self.frames: deque = deque(maxlen=max_frames)
+        self.stack: list[list] = []  # [label, start, time in nested calls]
+        self.hooks: list[tuple] = []  # (owner, name, original or None) to restore
+        self.frame_index = 0
+        self.frame_start = 0.0
+        self.totals: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.events: list[tuple] = []  # (label, start, duration, depth)
+        self.font = None
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.frames.clear()
+        self.install_hooks()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.remove_hooks()
+        self.stack.clear()
+
+    def install_hooks(self):
+        for entity_type in all_subclasses(Entity):
+            for name in ENTITY_METHODS:
+                if hasattr(entity_type, name):
+                    label = f"{entity_type.__name__}.{name}"
+                    self.hook(entity_type, name, label, exact_type=True)
+        for owner, name, label in STAGE_HOOKS:
+            self.hook(owner, name, label)
+
+    def hook(self, owner, name: str, label: str, exact_type: bool = False):
+        """Replace owner.name with a timed wrapper
+
+        With exact_type, only calls on instances of exactly that class are timed,
+        so a subclass calling super() is not counted under its parent's label.
+        """
+        original = getattr(owner, name)
+        saved = owner.__dict__.get(name)  # None when inherited or a bound method
+        push, pop = self.push, self.pop
+
+        if exact_type:
+
+            def timed(instance, *args, **kwargs):
+                if type(instance) is not owner:
+                    return original(instance, *args, **kwargs)
+                push(label)
+                try:
+                    return original(instance, *args, **kwargs)
+                finally:
+                    pop()
+
+        else:
+
+            def timed(*args, **kwargs):
+                push(label)
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    pop()
+
+        setattr(owner, name, timed)
+        self.hooks.append((owner, name, saved))
+
+    def remove_hooks(self):
+        for owner, name, saved in reversed(self.hooks):
+            if saved is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, saved)
+        self.hooks.clear()
+
+    def section(self, label: str):
+        """Context manager timing a block of code, free when disabled"""
+        if not self.enabled:
+            return _disabled_section
+        return _Section(self, label)
+
+    def push(self, label: str):
+        self.stack.append([label, time.perf_counter(), 0.0])
+
+    def pop(self):
+        end = time.perf_counter()
+        label, start, nested = self.stack.pop()
+        duration = end - start
+        self.totals[label] = self.totals.get(label, 0.0) + duration - nested
+        self.calls[label] = self.calls.get(label, 0) + 1
+        self.events.append((label, start, duration, len(self.stack)))
+        if self.stack:
+            self.stack[-1][2] += duration
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.totals = {}
+        self.calls = {}
+        self.events = []
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frames.append(
+            {
+                "frame": self.frame_index,
+                "start": self.frame_start,
+                "duration": time.perf_counter() - self.frame_start,
+                "totals": self.totals,
+                "calls": self.calls,
+                "events": self.events,
+            }
+        )
+        self.frame_index += 1
+
+    def averages(self, frame_count: int = 60) -> tuple[float, dict[str, float]]:
+        """Mean frame time and mean self time per label over recent frames, in ms"""
+        frames = list(self.frames)[-frame_count:]
+        if not frames:
+            return 0.0, {}
+        totals: dict[str, float] = {}
+        for frame in frames:
+            for label, seconds in frame["totals"].items():
+                totals[label] = totals.get(label, 0.0) + seconds
+        scale = 1000 / len(frames)
+        frame_ms = sum(frame["duration"] for frame in frames) * scale
+        return frame_ms, {label: total * scale for label, total in totals.items()}
+
+    def draw_overlay(self, screen: pygame.Surface, rows: int = 12):
+        """Draw frame time and the slowest labels over recent frames in the top left"""
+        if not self.enabled:
+            return
+        if self.font is None:
+            self.font = pygame.font.Font(None, 22)
+
+        frame_ms, label_ms = self.averages()
+        slowest = sorted(label_ms.items(), key=lambda item: item[1], reverse=True)
+        lines = [f"frame {frame_ms:6.2f} ms"]
+        lines += [f"{ms:6.2f}  {label}" for label, ms in slowest[:rows]]
+
+        line_height = self.font.get_linesize()
+        panel = pygame.Surface((320, line_height * len(lines) + 10))
+        panel.set_alpha(200)
+        panel.fill((0, 0, 0))
+        screen.blit(panel, (10, 70))
+        for row, line in enumerate(lines):
+            text = self.font.render(line, True, (255, 255, 255))
+            screen.blit(text, (15, 75 + row * line_height))
+
+    def export_chrome_trace(self, path: str):
+        """Write the buffered frames in Chrome trace event format (chrome://tracing)"""
+        if not self.frames:
+            return
+        origin = self.frames[0]["start"]
+        trace_events = []
+        for frame in self.frames:
+            trace_events.append(
+                {
+                    "name": f"frame {frame['frame']}",
+                    "ph": "X",
+                    "ts": (frame["start"] - origin) * 1e6,
+                    "dur": frame["duration"] * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                }
+            )
+            for label, start, duration, depth in frame["events"]:
+                trace_events.append(
+                    {
+                        "name": label,
+                        "ph": "X",
+                        "ts": (start - origin) * 1e6,
+                        "dur": duration * 1e6,
+                        "pid": 0,
+                        "tid": 0,
+                        "args": {"depth": depth},
+                    }
+                )
+        with open(path, "w") as output:
+            json.dump({"traceEvents": trace_events}, output)
+
+    def export_json(self, path: str):
+        """Write per-frame self time (ms) and call counts for every label"""
+        frames = [
+            {
+                "frame": frame["frame"],
+                "duration_ms": frame["duration"] * 1000,
+                "self_ms": {
+                    label: seconds * 1000 for label, seconds in frame["totals"].items()
+                },
+                "calls": frame["calls"],
+            }
+            for frame in self.frames
+        ]
+        with open(path, "w") as output:
+            json.dump({"frames": frames}, output, indent=2)
+
+
+profiler = Profiler()
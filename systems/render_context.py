@@ -0,0 +1,85 @@
+import pygame
+
+
+class RenderContext:
+    """Where and when entities draw this frame
+
+    Passed to every draw and draw_shadow call instead of pointing each entity's
+    screen at the current target. alpha is how far the frame is between the last
+    two simulation steps. With track_dirty, the bounding rect of everything drawn
+    through blit() and mark() is collected for partial display updates.
+    """
+
+    def __init__(
+        self, surface: pygame.Surface, alpha: float = 1.0, track_dirty: bool = False
+    ):
+        self.surface = surface
+        self.alpha = alpha
+        self.track_dirty = track_dirty
+        self.dirty_rects: list[pygame.Rect] = []
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0):
+        rect = self.surface.blit(source, dest, area, special_flags)
+        if self.track_dirty:
+            self.dirty_rects.append(rect)
+        return rect
+
+    def mark(self, rect: pygame.Rect) -> pygame.Rect:
+        """Record a rect drawn without blit(), such as one returned by pygame.draw"""
+        if self.track_dirty:
+            self.dirty_rects.append(rect)
+        return rect
+
+    def take_dirty_rects(self) -> list[pygame.Rect]:
+        """Rects drawn since the last call"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+
+
+def rect_tiles(
+    rects: list[pygame.Rect], tile_size: int, bounds: pygame.Rect
+) -> set[tuple[int, int]]:
+    """Grid tiles inside bounds touched by any of the rects"""
+    tiles = set()
+    max_x = (bounds.right - 1) // tile_size
+    max_y = (bounds.bottom - 1) // tile_size
+    for rect in rects:
+        rect = rect.clip(bounds)
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        left, top = rect.left // tile_size, rect.top // tile_size
+        right = min(max_x, (rect.right - 1) // tile_size)
+        bottom = min(max_y, (rect.bottom - 1) // tile_size)
+        for tile_y in range(top, bottom + 1):
+            for tile_x in range(left, right + 1):
+                tiles.add((tile_x, tile_y))
+    return tiles
+
+
+def tiles_to_rects(tiles: set[tuple[int, int]], tile_size: int) -> list[pygame.Rect]:
+    """Cover a set of tiles with one rect per horizontal run of tiles
+
+    Edge tiles may reach past the screen, blits and display updates clip them.
+    """
+    rects = []
+    run_start = previous = None
+    for tile in sorted(tiles, key=lambda tile: (tile[1], tile[0])):
+        if previous and tile[1] == previous[1] and tile[0] == previous[0] + 1:
+            previous = tile
+            continue
+        if previous:
+            rects.append(run_rect(run_start, previous, tile_size))
+        run_start = previous = tile
+    if previous:
+        rects.append(run_rect(run_start, previous, tile_size))
+    return rects
+
+
+def run_rect(start: tuple, end: tuple, tile_size: int) -> pygame.Rect:
+    return pygame.Rect(
+        start[0] * tile_size,
+        start[1] * tile_size,
+        (end[0] - start[0] + 1) * tile_size,
+        tile_size,
+    )
@@ -0,0 +1,68 @@
+import pygame
+
+
+class SpatialHash:
+    """Uniform grid that buckets actors by position for broadphase collision queries"""
+
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list] = {}
+        self.entity_cells: dict[object, tuple[int, int]] = {}  # Entity -> its cell
+        self.max_radius = 0  # Largest collision radius stored, widens queries
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.max_radius = 0
+
+    def insert(self, entity):
+        cell = self.cell_of(entity.pos.x, entity.pos.y)
+        self.cells.setdefault(cell, []).append(entity)
+        self.entity_cells[entity] = cell
+        if entity.collision_radius > self.max_radius:
+            self.max_radius = entity.collision_radius
+
+    def remove(self, entity):
+        cell = self.entity_cells.pop(entity, None)
+        if cell is None:
+            return
+
+        bucket = self.cells[cell]
+        bucket.remove(entity)
+        if not bucket:
+            del self.cells[cell]
+
+    def update(self, entity):
+        """Move an entity to its current cell, called once after it moves each frame"""
+        old_cell = self.entity_cells.get(entity)
+        if old_cell is None:
+            return
+
+        cell = self.cell_of(entity.pos.x, entity.pos.y)
+        if cell != old_cell:
+            self.remove(entity)
+            self.insert(entity)
+
+    def rebuild(self, entities):
+        """Re-bucket every entity from scratch"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+
+    def query(self, pos: pygame.Vector2, radius: float) -> list:
+        """Return every entity stored in a cell that a circle at pos could touch"""
+        reach = radius + self.max_radius
+        min_x, min_y = self.cell_of(pos.x - reach, pos.y - reach)
+        max_x, max_y = self.cell_of(pos.x + reach, pos.y + reach)
+
+        candidates = []
+        cells = self.cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
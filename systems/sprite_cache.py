@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from functools import lru_cache
+
+import pygame
+
+# Fill passes that turn a rotated sprite into its black silhouette
+SHADOW_FILLS = (((0, 0, 0, 255), pygame.BLEND_RGBA_MULT),)
+
+
+@lru_cache(maxsize=None)
+def tint_fills(tint: tuple) -> tuple:
+    """Fill passes that multiply a sprite by an RGB tint while keeping its shape"""
+    return ((tuple(tint[:3]) + (255,), pygame.BLEND_RGB_MULT),)
+
+
+@lru_cache(maxsize=None)
+def flash_fills(multiply: tuple, add: tuple) -> tuple:
+    """Fill passes for a damage flash: multiply by one color, then add another"""
+    return (
+        (tuple(multiply[:3]) + (255,), pygame.BLEND_RGB_MULT),
+        (tuple(add[:3]) + (0,), pygame.BLEND_RGB_ADD),
+    )
+
+
+def apply_fills(surface: pygame.Surface, fills: tuple) -> pygame.Surface:
+    """Copy of surface with (color, special_flags) fill passes applied in order"""
+    filled = surface.copy()
+    for color, special_flags in fills:
+        filled.fill(color, special_flags=special_flags)
+    return filled
+
+
+class SpriteCache:
+    """LRU cache of rotated sprites and their pre-filled variants
+
+    Entries are keyed by the identity of the source surface, the angle snapped to
+    angle_step degrees and the fill passes applied after rotation. Each entry keeps
+    a reference to its source so the id cannot be reused while it is cached.
+    Cached surfaces are shared and must not be modified by callers.
+    """
+
+    def __init__(self, angle_step: float = 2.0, memory_budget: int = 64 * 1024 * 1024):
+        self.entries: OrderedDict = OrderedDict()  # key -> (source, surface, bytes)
+        self.memory_budget = memory_budget  # Bytes of pixel data kept before evicting
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.set_angle_step(angle_step)
+
+    def set_angle_step(self, angle_step: float):
+        """Change the rotation bucket size in degrees, dropping every cached entry"""
+        self.angle_step = angle_step
+        self.bucket_count = max(1, round(360 / angle_step))
+        self.clear()
+
+    def quantize(self, angle: float) -> int:
+        """Snap an angle in degrees to its bucket index"""
+        return round(angle / self.angle_step) % self.bucket_count
+
+    def get_rotated(self, sprite: pygame.Surface, angle: float) -> pygame.Surface:
+        """Sprite rotated to face angle degrees, as returned by Vector2.angle_to"""
+        return self.get_filled(sprite, angle)
+
+    def get_shadow(self, sprite: pygame.Surface, angle: float) -> pygame.Surface:
+        """Black silhouette of the rotated sprite"""
+        return self.get_filled(sprite, angle, SHADOW_FILLS)
+
+    def get_filled(
+        self, sprite: pygame.Surface, angle: float, fills: tuple = ()
+    ) -> pygame.Surface:
+        """Rotated sprite with (color, special_flags) fill passes applied in order"""
+        bucket = self.quantize(angle)
+        key = (id(sprite), bucket, fills)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        if not fills:
+            return self._rotated(sprite, bucket)
+        surface = apply_fills(self._rotated(sprite, bucket), fills)
+        self._store(key, sprite, surface)
+        return surface
+
+    def _rotated(self, sprite: pygame.Surface, bucket: int) -> pygame.Surface:
+        """Cached plain rotation for a bucket, without counting a hit or miss"""
+        key = (id(sprite), bucket, ())
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        surface = pygame.transform.rotate(sprite, -bucket * self.angle_step)
+        self._store(key, sprite, surface)
+        return surface
+
+    def _store(self, key, source: pygame.Surface, surface: pygame.Surface):
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.entries[key] = (source, surface, size)
+        self.memory_used += size
+
+        # Evict least recently used entries, always keeping the newest one
+        while self.memory_used > self.memory_budget and len(self.entries) > 1:
+            _, (_, _, evicted_size) = self.entries.popitem(last=False)
+            self.memory_used -= evicted_size
+
+    def clear(self):
+        self.entries.clear()
+        self.memory_used = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.entries),
+            "memory_used": self.memory_used,
+            "angle_step": self.angle_step,
+        }
+
+
+sprite_cache = SpriteCache()
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextRenderer:
+    """Shared fonts and an LRU cache of rendered strings
+
+    Fonts are loaded once per (name, size, bold). Rendered text is keyed by the
+    string, the font and the colour. Cached surfaces are shared and must not be
+    modified by callers.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.fonts: dict[tuple, pygame.font.Font] = {}
+        self.entries: OrderedDict = OrderedDict()  # key -> rendered surface
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(
+        self, name: str | None = None, size: int = 36, bold: bool = False
+    ) -> pygame.font.Font:
+        """pygame's default font when name is None, otherwise a system font"""
+        key = (name, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+            else:
+                font = pygame.font.SysFont(name, size, bold)
+            self.fonts[key] = font
+        return font
+
+    def render(
+        self,
+        text: str,
+        color,
+        name: str | None = None,
+        size: int = 36,
+        bold: bool = False,
+    ) -> pygame.Surface:
+        """Antialiased text, rendered only the first time it is asked for"""
+        key = (text, name, size, bold, color)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(name, size, bold).render(text, True, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.fonts.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.entries),
+            "fonts": len(self.fonts),
+        }
+
+
+text_renderer = TextRenderer()
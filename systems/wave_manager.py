@@ -4,6 +4,7 @@ from entities.dasher import Dasher
 from entities.enemy import Enemy
 from entities.wanderer import Wanderer
 from systems.entity_manager import EntityManager
+from tags.tags import Tag
 
 
 class WaveManager:
@@ -57,11 +58,8 @@ class WaveManager:
                 self.enemies_spawned += 1
                 self.time_since_last_spawn = 0.0
         else:
-            # Check if all enemies are defeated (both Enemy and Wanderer types)
-            if not any(
-                isinstance(entity, (Enemy, Wanderer, Dasher))
-                for entity in self.entity_manager.entities
-            ):
+            # Check if all enemies are defeated
+            if self.entity_manager.count(Tag.ENEMY) == 0:
                 self.wave_in_progress = False
                 print(f"Wave {self.current_wave_index} completed!")
                 self.start_next_wave()
@@ -1,11 +1,78 @@
-from enum import Enum
+from enum import IntFlag
 
 
-class Tag(Enum):
-    NONE = "none"
-    PLAYER = "player"
-    ENEMY = "enemy"
-    BULLET = "bullet"
-    HAZARD = "hazard"
-    WALL = "wall"
-    PICKUP = "pickup"
+class Tag(IntFlag):
+    NONE = 0
+    PLAYER = 1 << 0
+    ENEMY = 1 << 1
+    BULLET = 1 << 2
+    HAZARD = 1 << 3
+    WALL = 1 << 4
+    PICKUP = 1 << 5
+
+
+# Single-bit tags in declaration order, used to iterate a mask
+SINGLE_TAGS = tuple(tag for tag in Tag.__members__.values() if tag)
+
+
+class TagSet:
+    """An entity's tags packed into one integer bitmask
+
+    Keeps the list-style API (append, in, iteration, copy) that entities already
+    use, while overlap checks between two entities are a single AND.
+    """
+
+    __slots__ = ("mask",)  # Plain int, so AND tests skip IntFlag's Python-level ops
+
+    def __init__(self, tags=()):
+        self.mask = 0
+        self.update(tags)
+
+    def append(self, tag: Tag):
+        self.mask |= int(tag)
+
+    add = append
+
+    def update(self, tags):
+        """Add every tag from another TagSet or any iterable of tags"""
+        if isinstance(tags, TagSet):
+            self.mask |= tags.mask
+            return
+        for tag in tags:
+            self.mask |= int(tag)
+
+    def remove(self, tag: Tag):
+        if not self.mask & int(tag):
+            raise ValueError(f"{tag!r} not in tags")
+        self.mask &= ~int(tag)
+
+    def discard(self, tag: Tag):
+        self.mask &= ~int(tag)
+
+    def clear(self):
+        self.mask = 0
+
+    def copy(self) -> "TagSet":
+        tags = TagSet()
+        tags.mask = self.mask
+        return tags
+
+    def overlaps(self, other: "TagSet") -> bool:
+        """True when the two sets share at least one tag"""
+        return bool(self.mask & other.mask)
+
+    def __contains__(self, tag: Tag) -> bool:
+        return bool(self.mask & int(tag))
+
+    def __iter__(self):
+        mask = self.mask
+        return (tag for tag in SINGLE_TAGS if mask & tag)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __repr__(self) -> str:
+        return f"TagSet({list(self)!r})"
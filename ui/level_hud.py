@@ -1,8 +1,20 @@
 import pygame
 
+from systems.text_renderer import text_renderer
+
 
 class LevelHud:
-    def render(self, screen: pygame.Surface, dt: float, player, wave_manager):
+    def __init__(self):
+        # Last shown values and their rendered text, re-rendered when they change
+        self.wave = None
+        self.wave_text = None
+        self.score = None
+        self.score_text = None
+
+    def render(
+        self, screen: pygame.Surface, dt: float, player, wave_manager
+    ) -> list[pygame.Rect]:
+        """Draw the HUD, returning the screen areas it covers"""
         health_bar_width = 200
         health_bar_height = 40
         health_ratio = player.hp / player.max_hp
@@ -34,20 +46,18 @@ class LevelHud:
         )
 
         # render current wave
-        font = pygame.font.Font(None, 36)
-        wave_text = font.render(
-            f"Wave: {wave_manager.current_wave_index}",
-            True,
-            (
-                255,
-                255,
-                255,
-            ),
-        )
-        screen.blit(wave_text, (screen.get_width() - 150, 10))
+        if wave_manager.current_wave_index != self.wave:
+            self.wave = wave_manager.current_wave_index
+            self.wave_text = text_renderer.render(f"Wave: {self.wave}", (255, 255, 255))
+        wave_rect = screen.blit(self.wave_text, (screen.get_width() - 150, 10))
 
         # render current score
-        score_text = font.render(
-            f"Score: {player.entity_manager.score}", True, (255, 255, 255)
-        )
-        screen.blit(score_text, (screen.get_width() - 150, 50))
+        if player.entity_manager.score != self.score:
+            self.score = player.entity_manager.score
+            self.score_text = text_renderer.render(
+                f"Score: {self.score}", (255, 255, 255)
+            )
+        score_rect = screen.blit(self.score_text, (screen.get_width() - 150, 50))
+
+        bars_rect = pygame.Rect(10, 10, health_bar_width, health_bar_height + 10)
+        return [bars_rect, wave_rect, score_rect]
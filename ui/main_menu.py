@@ -2,12 +2,22 @@ import pygame
 
 from scenes.level import Level
 from scenes.scene import Scene
+from systems.input_source import InputState
 
 
 class MainMenu(Scene):
     # start game button
-    def __init__(self, screen: pygame.Surface, switch_scene_callback):
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        switch_scene_callback,
+        dirty_rects: bool = False,
+        batch_enemies: bool = False,
+    ):
         self.screen = screen
+        self.dirty_rects = dirty_rects  # Draw once and leave the display alone
+        self.batch_enemies = batch_enemies  # Passed on to the level
+        self.drawn = False
         self.font = pygame.font.Font(None, 74)
         self.start_button_rect = pygame.Rect(
             screen.get_width() // 2 - 150,
@@ -20,17 +30,22 @@ class MainMenu(Scene):
     def setup(self):
         return super().setup()
 
-    def render(self, dt: float):
-        self.screen.fill((0, 0, 255))
-        pygame.draw.rect(self.screen, (255, 255, 0), self.start_button_rect)
-        text = self.font.render("Start Game", True, (0, 0, 0))
-        text_rect = text.get_rect(center=self.start_button_rect.center)
-        self.screen.blit(text, text_rect)
-        pygame.display.flip()
+    def render(self, dt: float, input_state: InputState):
+        # Nothing on the menu moves, so it only needs drawing once
+        if not (self.dirty_rects and self.drawn):
+            self.screen.fill((0, 0, 255))
+            pygame.draw.rect(self.screen, (255, 255, 0), self.start_button_rect)
+            text = self.font.render("Start Game", True, (0, 0, 0))
+            text_rect = text.get_rect(center=self.start_button_rect.center)
+            self.screen.blit(text, text_rect)
+            pygame.display.flip()
+            self.drawn = True
 
-        self.update(dt)
+        self.update(dt, input_state)
 
-    def update(self, dt: float):
-        if pygame.mouse.get_pressed()[0]:
-            if self.start_button_rect.collidepoint(pygame.mouse.get_pos()):
-                self.switch_scene_callback(Level(self.screen))
+    def update(self, dt: float, input_state: InputState):
+        if input_state.mouse_pressed(0):
+            if self.start_button_rect.collidepoint(input_state.mouse_pos()):
+                self.switch_scene_callback(
+                    Level(self.screen, self.dirty_rects, self.batch_enemies)
+                )